@@ -7,58 +7,101 @@ Supports multiple configuration sources with priority:
 4. Defaults (lowest priority)
 """
 
-import argparse
+import hashlib
 import logging
 import os
+import pickle
+import sys
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, NoReturn, cast
 
 logger = logging.getLogger("mssql_mcp_server.config")
 
+# Shared empty result for the validate() happy path
+_EMPTY: tuple[str, ...] = ()
 
+# Interned default strings shared by the dataclass defaults, the env
+# spec, and the TOML loader; interning keeps identity comparison and
+# dict-key hashing cheap wherever configs are keyed by these values.
+_DEFAULT_SERVER = sys.intern("localhost")
+_DEFAULT_DATABASE = sys.intern("master")
+_DEFAULT_DRIVER = sys.intern("ODBC Driver 17 for SQL Server")
+
+# Memoized tomllib reference; TOML support is only needed when --config
+# is passed, so defer the import until the first actual load.
+_tomllib: Any = None
+
+# Cap on cached config entries: every (path, mtime, size) edit creates a
+# new cache file, so without pruning the directory grows forever.
+_CACHE_MAX_ENTRIES = 32
+
+
+@dataclass(slots=True, frozen=True)
 class ServerConfig:
-    """Server configuration with validation."""
-
-    def __init__(
-        self,
-        server: str = "localhost",
-        database: str = "master",
-        driver: str = "ODBC Driver 17 for SQL Server",
-        connection_timeout: int = 30,
-        query_timeout: int = 30,
-        max_retries: int = 3,
-        retry_delay: float = 1.0,
-        config_file: Path | None = None,
-    ):
-        """Initialize server configuration.
-
-        Args:
-            server: SQL Server hostname
-            database: Database name
-            driver: ODBC driver name
-            connection_timeout: Connection timeout in seconds
-            query_timeout: Query execution timeout in seconds
-            max_retries: Maximum number of retry attempts for transient errors
-            retry_delay: Base retry delay in seconds (exponential backoff)
-            config_file: Path to TOML config file
+    """Server configuration with validation.
+
+    Frozen slots-based dataclass: instances are immutable, attribute
+    access goes through slot descriptors instead of a per-instance
+    ``__dict__``, and construction skips the dict allocation entirely.
+    Use :func:`dataclasses.replace` to derive modified configurations.
+
+    Attributes:
+        server: SQL Server hostname
+        database: Database name
+        driver: ODBC driver name
+        connection_timeout: Connection timeout in seconds
+        query_timeout: Query execution timeout in seconds
+        max_retries: Maximum number of retry attempts for transient errors
+        retry_delay: Base retry delay in seconds (exponential backoff)
+        max_delay: Upper bound on a single backoff delay in seconds
+        config_file: Path to TOML config file
 
-        """
-        self.server = server
-        self.database = database
-        self.driver = driver
-        self.connection_timeout = connection_timeout
-        self.query_timeout = query_timeout
-        self.max_retries = max_retries
-        self.retry_delay = retry_delay
-        self.config_file = config_file
-
-    def validate(self) -> list[str]:
-        """Validate configuration and return list of errors.
+    """
+
+    server: str = _DEFAULT_SERVER
+    database: str = _DEFAULT_DATABASE
+    driver: str = _DEFAULT_DRIVER
+    connection_timeout: int = 30
+    query_timeout: int = 30
+    max_retries: int = 3
+    retry_delay: float = 1.0
+    max_delay: float = 30.0
+    config_file: Path | None = None
+
+    # Lazily built mapping view; excluded from init/repr/eq so it stays
+    # an invisible cache slot
+    _as_dict_cache: "MappingProxyType[str, Any] | None" = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def validate(self) -> tuple[str, ...]:
+        """Validate configuration and return error messages.
+
+        The happy path is a single boolean pass that allocates nothing;
+        error messages are only formatted once a check has failed.
 
         Returns:
-            List of validation error messages (empty if valid)
+            Tuple of validation error messages (empty if valid)
 
         """
+        ok = bool(
+            self.server
+            and self.server.strip()
+            and self.database
+            and self.database.strip()
+            and self.driver
+            and self.driver.strip()
+            and 0 < self.connection_timeout <= 300
+            and 0 < self.query_timeout <= 3600
+            and 0 <= self.max_retries <= 10
+            and 0 <= self.retry_delay <= 60
+            and 0 <= self.max_delay <= 300
+        )
+        if ok:
+            return _EMPTY
+
         errors = []
 
         # Validate server
@@ -103,91 +146,257 @@ class ServerConfig:
         elif self.retry_delay > 60:
             errors.append(f"Retry delay too large (got {self.retry_delay}, max 60)")
 
-        return errors
+        # Validate max_delay
+        if self.max_delay < 0:
+            errors.append(f"Max delay must be non-negative (got {self.max_delay})")
+        elif self.max_delay > 300:
+            errors.append(f"Max delay too large (got {self.max_delay}, max 300)")
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert configuration to dictionary.
+        return tuple(errors)
+
+    @property
+    def as_dict(self) -> "MappingProxyType[str, Any]":
+        """Read-only mapping view of the configuration (cached).
+
+        The underlying dict is built once per instance -- the config is
+        frozen, so repeated serialization (logging, health endpoints)
+        reuses the same mapping.
 
         Returns:
-            Configuration as dictionary
+            Read-only configuration mapping (config_file excluded)
 
         """
-        return {
-            "server": self.server,
-            "database": self.database,
-            "driver": self.driver,
-            "connection_timeout": self.connection_timeout,
-            "query_timeout": self.query_timeout,
-            "max_retries": self.max_retries,
-            "retry_delay": self.retry_delay,
-        }
-
-    def __repr__(self) -> str:
-        """Return string representation (safe, no secrets).
+        cached = self._as_dict_cache
+        if cached is None:
+            cached = MappingProxyType(
+                {
+                    "server": self.server,
+                    "database": self.database,
+                    "driver": self.driver,
+                    "connection_timeout": self.connection_timeout,
+                    "query_timeout": self.query_timeout,
+                    "max_retries": self.max_retries,
+                    "retry_delay": self.retry_delay,
+                    "max_delay": self.max_delay,
+                }
+            )
+            object.__setattr__(self, "_as_dict_cache", cached)
+        return cached
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert configuration to a mutable dictionary.
+
+        Callers that only read should prefer :attr:`as_dict`, which
+        avoids the copy.
 
         Returns:
-            String representation of configuration
+            Configuration as dictionary (config_file excluded)
 
         """
-        return (
-            f"ServerConfig(server={self.server!r}, "
-            f"database={self.database!r}, "
-            f"driver={self.driver!r}, "
-            f"connection_timeout={self.connection_timeout}, "
-            f"query_timeout={self.query_timeout}, "
-            f"max_retries={self.max_retries}, "
-            f"retry_delay={self.retry_delay})"
-        )
+        return dict(self.as_dict)
+
+
+# (field, environment variable, default, caster) table for load_from_env
+_ENV_SPEC: tuple[tuple[str, str, str, Any], ...] = (
+    ("server", "MSSQL_SERVER", _DEFAULT_SERVER, str),
+    ("database", "MSSQL_DATABASE", _DEFAULT_DATABASE, str),
+    ("driver", "ODBC_DRIVER", _DEFAULT_DRIVER, str),
+    ("connection_timeout", "MSSQL_CONNECTION_TIMEOUT", "30", int),
+    ("query_timeout", "MSSQL_QUERY_TIMEOUT", "30", int),
+    ("max_retries", "MSSQL_MAX_RETRIES", "3", int),
+    ("retry_delay", "MSSQL_RETRY_DELAY", "1.0", float),
+    ("max_delay", "MSSQL_MAX_DELAY", "30.0", float),
+)
 
 
 def load_from_env() -> ServerConfig:
     """Load configuration from environment variables.
 
+    Reads are driven by the ``_ENV_SPEC`` table in a single loop, so
+    adding a config field means adding one spec entry.
+
     Returns:
         Configuration loaded from environment
 
     """
-    return ServerConfig(
-        server=os.environ.get("MSSQL_SERVER", "localhost"),
-        database=os.environ.get("MSSQL_DATABASE", "master"),
-        driver=os.environ.get("ODBC_DRIVER", "ODBC Driver 17 for SQL Server"),
-        connection_timeout=int(os.environ.get("MSSQL_CONNECTION_TIMEOUT", "30")),
-        query_timeout=int(os.environ.get("MSSQL_QUERY_TIMEOUT", "30")),
-        max_retries=int(os.environ.get("MSSQL_MAX_RETRIES", "3")),
-        retry_delay=float(os.environ.get("MSSQL_RETRY_DELAY", "1.0")),
-    )
+    env = os.environ
+    kwargs = {
+        field: caster(env.get(var, default))
+        for field, var, default, caster in _ENV_SPEC
+    }
+    return ServerConfig(**kwargs)
 
 
-def load_from_toml(config_path: Path) -> ServerConfig:
-    """Load configuration from TOML file.
+def _config_cache_path(config_path: Path, stat: os.stat_result) -> Path:
+    """Return the cache file path for a config file's current contents.
+
+    The key incorporates the file's path, mtime, and size, so any edit to
+    the config file automatically invalidates the cached entry.
 
     Args:
         config_path: Path to TOML config file
+        stat: Stat result for the config file
 
     Returns:
-        Configuration loaded from TOML
+        Path to the pickled cache entry
+
+    """
+    cache_key = hashlib.blake2b(
+        f"{config_path.resolve()}|{stat.st_mtime_ns}|{stat.st_size}".encode()
+    ).hexdigest()
+    return Path.home() / ".cache" / "mssql-mcp-server" / f"{cache_key}.pkl"
+
+
+def _load_cached_fields(cache_path: Path) -> "dict[str, Any] | None":
+    """Load a previously cached TOML field dict, or None if unavailable.
+
+    Args:
+        cache_path: Path to the pickled cache entry
+
+    Returns:
+        Cached field dict, or None on miss or corrupt entry
+
+    """
+    try:
+        with cache_path.open("rb") as f:
+            cached = pickle.load(f)  # noqa: S301 - cache dir is user-owned
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+
+    if isinstance(cached, dict):
+        logger.debug(f"Loaded cached configuration from {cache_path}")
+        return cached
+    return None
+
+
+def _prune_cache_dir(cache_dir: Path) -> None:
+    """Drop the oldest cache entries once the directory exceeds the cap.
+
+    Stale entries accumulate because each edit of a config file produces
+    a new (path, mtime, size) key; pruning by mtime keeps the directory
+    bounded without touching entries still in use.
+
+    Args:
+        cache_dir: Directory holding the pickled cache entries
+
+    """
+    entries = sorted(cache_dir.glob("*.pkl"), key=lambda p: p.stat().st_mtime)
+    for stale in entries[: len(entries) - _CACHE_MAX_ENTRIES]:
+        stale.unlink(missing_ok=True)
+
+
+def _write_cached_fields(cache_path: Path, fields: "dict[str, Any]") -> None:
+    """Write a TOML field dict to the cache atomically (best-effort).
+
+    Args:
+        cache_path: Path to the pickled cache entry
+        fields: Field dict to cache
+
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with tmp_path.open("wb") as f:
+            pickle.dump(fields, f)
+        # Atomic rename avoids torn files if two processes race
+        os.replace(tmp_path, cache_path)
+        _prune_cache_dir(cache_path.parent)
+    except OSError as e:
+        logger.debug(f"Could not write config cache: {e}")
+
+
+def _extract_mssql_section(raw: bytes) -> bytes | None:
+    """Slice the ``[mssql]`` table (and its subtables) out of raw TOML.
+
+    Scans table headers line by line so only the relevant section is
+    handed to tomllib -- O(section) instead of O(file) for configs that
+    carry large unrelated tables. Returns None whenever the section
+    cannot be isolated unambiguously (e.g. quoted table headers), in
+    which case the caller parses the full document.
+
+    Args:
+        raw: Raw TOML file contents
+
+    Returns:
+        Bytes of the [mssql] section, or None if it cannot be isolated
+
+    """
+    lines = raw.splitlines(keepends=True)
+    start: int | None = None
+    end = len(lines)
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if not stripped.startswith(b"["):
+            continue
+        if b'"' in stripped or b"'" in stripped:
+            # Quoted table headers are beyond this fast path
+            return None
+        if start is None:
+            if stripped == b"[mssql]":
+                start = i
+        elif not stripped.startswith((b"[mssql.", b"[[mssql.")):
+            end = i
+            break
+    if start is None:
+        return None
+    return b"".join(lines[start:end])
+
+
+def _read_toml_fields(config_path: Path) -> dict[str, Any]:
+    """Read the config fields a TOML file actually sets.
+
+    Only fields present in the file are returned, so callers can layer
+    their own fallbacks (dataclass defaults or environment variables)
+    underneath. Parsed field dicts are cached as pickles in
+    ``~/.cache/mssql-mcp-server/`` keyed on (path, mtime, size), so warm
+    starts skip TOML parsing entirely. Set ``MSSQL_CONFIG_NOCACHE=1`` to
+    bypass the cache.
+
+    Args:
+        config_path: Path to TOML config file
+
+    Returns:
+        Mapping of config field name to value for fields set in the file
 
     Raises:
         FileNotFoundError: If config file doesn't exist
         ValueError: If TOML is invalid or missing required fields
 
     """
-    if not config_path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
-
+    # EAFP: a single stat covers both the existence check and the cache
+    # key, instead of a separate exists() syscall
     try:
-        import tomli
-    except ImportError:
-        # Try tomllib (Python 3.11+)
+        stat = config_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+
+    use_cache = os.environ.get("MSSQL_CONFIG_NOCACHE") != "1"
+    cache_path: Path | None = None
+    if use_cache:
+        cache_path = _config_cache_path(config_path, stat)
+        cached = _load_cached_fields(cache_path)
+        if cached is not None:
+            return cached
+
+    global _tomllib
+    if _tomllib is None:
+        import tomllib
+
+        _tomllib = tomllib
+
+    raw = config_path.read_bytes()
+
+    # Prefer parsing just the [mssql] section; fall back to the full
+    # document when it cannot be isolated or the slice fails to parse
+    data = None
+    section = _extract_mssql_section(raw)
+    if section is not None:
         try:
-            import tomllib as tomli  # type: ignore
-        except ImportError:
-            raise ImportError(
-                "TOML support requires 'tomli' package. Install with: pip install tomli"
-            ) from None
-
-    with config_path.open("rb") as f:
-        data = tomli.load(f)
+            data = _tomllib.loads(section.decode("utf-8"))
+        except (_tomllib.TOMLDecodeError, UnicodeDecodeError):
+            data = None
+    if data is None:
+        data = _tomllib.loads(raw.decode("utf-8"))
 
     # Look for [mssql] section
     if "mssql" not in data:
@@ -195,32 +404,37 @@ def load_from_toml(config_path: Path) -> ServerConfig:
 
     mssql_config = data["mssql"]
 
-    return ServerConfig(
-        server=mssql_config.get("server", "localhost"),
-        database=mssql_config.get("database", "master"),
-        driver=mssql_config.get("driver", "ODBC Driver 17 for SQL Server"),
-        connection_timeout=mssql_config.get("connection_timeout", 30),
-        query_timeout=mssql_config.get("query_timeout", 30),
-        max_retries=mssql_config.get("max_retries", 3),
-        retry_delay=mssql_config.get("retry_delay", 1.0),
-        config_file=config_path,
-    )
+    fields = {
+        name: mssql_config[name] for name in _CONFIG_FIELDS if name in mssql_config
+    }
 
+    if cache_path is not None:
+        _write_cached_fields(cache_path, fields)
 
-def parse_cli_args(args: list[str] | None = None) -> argparse.Namespace:
-    """Parse command-line arguments.
+    return fields
+
+
+def load_from_toml(config_path: Path) -> ServerConfig:
+    """Load configuration from TOML file.
+
+    Fields missing from the file fall back to the dataclass defaults.
 
     Args:
-        args: Command-line arguments (defaults to sys.argv)
+        config_path: Path to TOML config file
 
     Returns:
-        Parsed arguments namespace
+        Configuration loaded from TOML
+
+    Raises:
+        FileNotFoundError: If config file doesn't exist
+        ValueError: If TOML is invalid or missing required fields
 
     """
-    parser = argparse.ArgumentParser(
-        description="MSSQL MCP Server - Read-only SQL Server access via MCP",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+    return ServerConfig(config_file=config_path, **_read_toml_fields(config_path))
+
+
+# Help epilog, only rendered when --help is actually requested
+_EPILOG = """
 Configuration Priority (highest to lowest):
   1. CLI arguments
   2. Config file (--config)
@@ -236,7 +450,65 @@ Environment Variables:
 Example:
   mssql-mcp-server --server sql.example.com --database MyDB
   mssql-mcp-server --config /path/to/config.toml
-        """,
+"""
+
+# Memoized argparse parser; only built when help is actually requested.
+_parser: Any = None
+
+# Config fields settable from the TOML file or the command line
+_CONFIG_FIELDS: tuple[str, ...] = (
+    "server",
+    "database",
+    "driver",
+    "connection_timeout",
+    "query_timeout",
+    "max_retries",
+    "retry_delay",
+    "max_delay",
+)
+
+# Flag -> (namespace field, caster) table for the hand-rolled parser
+_FLAG_SPEC: dict[str, tuple[str, Any]] = {
+    "--server": ("server", str),
+    "--database": ("database", str),
+    "--driver": ("driver", str),
+    "--connection-timeout": ("connection_timeout", int),
+    "--query-timeout": ("query_timeout", int),
+    "--max-retries": ("max_retries", int),
+    "--retry-delay": ("retry_delay", float),
+    "--max-delay": ("max_delay", float),
+    "--config": ("config", Path),
+}
+
+
+def _build_parser() -> Any:
+    """Construct the argparse parser used for help output.
+
+    argparse is imported here so non-help invocations never pay for it.
+
+    Returns:
+        Configured argument parser
+
+    """
+    import argparse
+
+    class LazyEpilogParser(argparse.ArgumentParser):
+        """ArgumentParser that defers epilog attachment until help is rendered."""
+
+        def format_help(self) -> str:
+            """Attach the epilog lazily, then render help as usual.
+
+            Returns:
+                Formatted help text
+
+            """
+            if self.epilog is None:
+                self.epilog = _EPILOG
+            return super().format_help()
+
+    parser = LazyEpilogParser(
+        description="MSSQL MCP Server - Read-only SQL Server access via MCP",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
     parser.add_argument(
@@ -271,6 +543,11 @@ Example:
         type=float,
         help="Base retry delay in seconds (exponential backoff)",
     )
+    parser.add_argument(
+        "--max-delay",
+        type=float,
+        help="Upper bound on a single backoff delay in seconds",
+    )
     parser.add_argument(
         "--config",
         type=Path,
@@ -282,7 +559,108 @@ Example:
         help="Validate configuration and exit",
     )
 
-    return parser.parse_args(args)
+    return parser
+
+
+def _cli_error(message: str) -> NoReturn:
+    """Report a CLI usage error and exit with argparse's error code.
+
+    Args:
+        message: Error message to print to stderr
+
+    Raises:
+        SystemExit: Always, with exit code 2
+
+    """
+    print(f"error: {message}", file=sys.stderr)
+    raise SystemExit(2)
+
+
+def _parse_argv(args: list[str]) -> SimpleNamespace:
+    """Parse CLI flags with a single pass over argv.
+
+    Handles both ``--flag value`` and ``--flag=value`` forms, matching
+    argparse semantics for the small flag set this server accepts.
+
+    Args:
+        args: Command-line arguments (without the program name)
+
+    Returns:
+        Namespace with one attribute per supported flag
+
+    Raises:
+        SystemExit: On unknown flags or invalid values
+
+    """
+    ns = SimpleNamespace(
+        server=None,
+        database=None,
+        driver=None,
+        connection_timeout=None,
+        query_timeout=None,
+        max_retries=None,
+        retry_delay=None,
+        max_delay=None,
+        config=None,
+        validate_only=False,
+    )
+
+    i = 0
+    n = len(args)
+    while i < n:
+        arg = args[i]
+        if arg == "--validate-only":
+            ns.validate_only = True
+            i += 1
+            continue
+
+        flag, eq, inline_value = arg.partition("=")
+        spec = _FLAG_SPEC.get(flag)
+        if spec is None:
+            _cli_error(f"unrecognized arguments: {arg}")
+        field, caster = spec
+
+        if eq:
+            value = inline_value
+        else:
+            i += 1
+            if i >= n:
+                _cli_error(f"argument {flag}: expected one argument")
+            value = args[i]
+
+        try:
+            setattr(ns, field, caster(value))
+        except ValueError:
+            _cli_error(f"argument {flag}: invalid {caster.__name__} value: {value!r}")
+        i += 1
+
+    return ns
+
+
+def parse_cli_args(args: list[str] | None = None) -> SimpleNamespace:
+    """Parse command-line arguments.
+
+    Uses a hand-rolled single-pass scanner for the normal path; argparse
+    (and its import cost) is only involved when help is requested.
+
+    Args:
+        args: Command-line arguments (defaults to sys.argv)
+
+    Returns:
+        Parsed arguments namespace
+
+    """
+    if args is None:
+        args = sys.argv[1:]
+
+    if "-h" in args or "--help" in args:
+        global _parser
+        if _parser is None:
+            _parser = _build_parser()
+        # Prints help and exits; cast because _parser is lazily typed
+        return cast("SimpleNamespace", _parser.parse_args(args))
+
+    return _parse_argv(args)
 
 
 def load_config(args: list[str] | None = None) -> ServerConfig:
@@ -306,42 +684,33 @@ def load_config(args: list[str] | None = None) -> ServerConfig:
     """
     cli_args = parse_cli_args(args)
 
-    # Start with defaults/environment
-    config = load_from_env()
-
-    # Override with config file if specified
     if cli_args.config:
+        # File-driven startup: skip the throwaway env snapshot and only
+        # consult the environment for fields the file omits
         try:
-            file_config = load_from_toml(cli_args.config)
-            # Merge file config (only non-default values)
-            config.server = file_config.server
-            config.database = file_config.database
-            config.driver = file_config.driver
-            config.connection_timeout = file_config.connection_timeout
-            config.query_timeout = file_config.query_timeout
-            config.max_retries = file_config.max_retries
-            config.retry_delay = file_config.retry_delay
-            config.config_file = file_config.config_file
+            fields = _read_toml_fields(cli_args.config)
             logger.info(f"Loaded configuration from {cli_args.config}")
         except Exception as e:
             logger.error(f"Failed to load config file: {e}")
             raise SystemExit(1) from e
 
+        env = os.environ
+        for field, var, default, caster in _ENV_SPEC:
+            if field not in fields:
+                fields[field] = caster(env.get(var, default))
+        config = ServerConfig(config_file=cli_args.config, **fields)
+    else:
+        # Start with defaults/environment
+        config = load_from_env()
+
     # Override with CLI arguments (highest priority)
-    if cli_args.server is not None:
-        config.server = cli_args.server
-    if cli_args.database is not None:
-        config.database = cli_args.database
-    if cli_args.driver is not None:
-        config.driver = cli_args.driver
-    if cli_args.connection_timeout is not None:
-        config.connection_timeout = cli_args.connection_timeout
-    if cli_args.query_timeout is not None:
-        config.query_timeout = cli_args.query_timeout
-    if cli_args.max_retries is not None:
-        config.max_retries = cli_args.max_retries
-    if cli_args.retry_delay is not None:
-        config.retry_delay = cli_args.retry_delay
+    overrides: dict[str, Any] = {}
+    for name in _CONFIG_FIELDS:
+        value = getattr(cli_args, name, None)
+        if value is not None:
+            overrides[name] = value
+    if overrides:
+        config = replace(config, **overrides)
 
     # Validate configuration
     errors = config.validate()
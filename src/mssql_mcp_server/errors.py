@@ -4,10 +4,45 @@ Defines typed exceptions for different error scenarios to provide
 clear, actionable error messages to MCP clients.
 """
 
+import functools
+import os
+from typing import Any, Protocol
+
+# pyodbc resolved once at module load; guarded so this module stays
+# importable in environments without the ODBC runtime.
+try:
+    import pyodbc as _pyodbc
+except ImportError:  # pragma: no cover - requires broken ODBC install
+    _pyodbc = None  # type: ignore[assignment]
+
+
+class _JsonModule(Protocol):
+    """Structural type for the subset of the json module used here."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize obj to a JSON string."""
+        ...
+
+
+# Memoized json reference; JSON encoding is only needed on error paths,
+# so defer the import until the first formatted response.
+_json: "_JsonModule | None" = None
+
+# MCP clients parse responses mechanically, so default to compact JSON
+# (the encoder's C fast path). MCP_PRETTY_ERRORS=1 restores indentation
+# for human debugging.
+if os.environ.get("MCP_PRETTY_ERRORS") == "1":
+    _JSON_KWARGS: dict = {"indent": 2, "ensure_ascii": False}
+else:
+    _JSON_KWARGS = {"separators": (",", ":"), "ensure_ascii": False}
+
 
 class MSSQLMCPError(Exception):
     """Base exception for all MSSQL MCP Server errors.
 
+    Subclasses set ``ERROR_CODE`` so the machine-readable code is read
+    once from the class rather than derived per instantiation.
+
     Attributes:
         error_code: Machine-readable error code
         message: Human-readable error message
@@ -15,6 +50,8 @@ class MSSQLMCPError(Exception):
 
     """
 
+    ERROR_CODE = "MSSQLMCPError"
+
     def __init__(
         self,
         message: str,
@@ -31,7 +68,7 @@ class MSSQLMCPError(Exception):
         """
         super().__init__(message)
         self.message = message
-        self.error_code = error_code or self.__class__.__name__
+        self.error_code = error_code or type(self).ERROR_CODE
         self.details = details or {}
 
     def to_dict(self) -> dict[str, str | dict[str, str]]:
@@ -55,6 +92,8 @@ class ConnectionError(MSSQLMCPError):
     Common causes: server unreachable, timeout, authentication failure.
     """
 
+    ERROR_CODE = "CONNECTION_ERROR"
+
     def __init__(self, message: str, details: dict[str, str] | None = None):
         """Initialize connection error.
 
@@ -65,7 +104,6 @@ class ConnectionError(MSSQLMCPError):
         """
         super().__init__(
             message=message,
-            error_code="CONNECTION_ERROR",
             details=details,
         )
 
@@ -77,6 +115,8 @@ class QueryError(MSSQLMCPError):
     Common causes: syntax error, permission denied, timeout.
     """
 
+    ERROR_CODE = "QUERY_ERROR"
+
     def __init__(
         self,
         message: str,
@@ -91,13 +131,14 @@ class QueryError(MSSQLMCPError):
             details: Additional context
 
         """
-        error_details = details or {}
-        if query:
-            error_details["query"] = query[:200]  # Truncate long queries
+        # Truncate long queries; built as one expression so the common
+        # no-details case never mutates (or copies) a dict
         super().__init__(
             message=message,
-            error_code="QUERY_ERROR",
-            details=error_details,
+            details={
+                **(details or {}),
+                **({"query": query[:200]} if query else {}),
+            },
         )
 
 
@@ -108,6 +149,8 @@ class SecurityError(MSSQLMCPError):
     dangerous operations (INSERT, UPDATE, DELETE, etc.).
     """
 
+    ERROR_CODE = "SECURITY_ERROR"
+
     def __init__(
         self,
         message: str,
@@ -122,15 +165,12 @@ class SecurityError(MSSQLMCPError):
             blocked_keyword: The dangerous keyword that triggered the block
 
         """
-        details: dict[str, str] = {}
-        if query:
-            details["query"] = query[:200]
-        if blocked_keyword:
-            details["blocked_keyword"] = blocked_keyword
         super().__init__(
             message=message,
-            error_code="SECURITY_ERROR",
-            details=details,
+            details={
+                **({"query": query[:200]} if query else {}),
+                **({"blocked_keyword": blocked_keyword} if blocked_keyword else {}),
+            },
         )
 
 
@@ -141,6 +181,8 @@ class ValidationError(MSSQLMCPError):
     Common causes: empty strings, invalid types, out-of-range values.
     """
 
+    ERROR_CODE = "VALIDATION_ERROR"
+
     def __init__(
         self,
         message: str,
@@ -155,15 +197,12 @@ class ValidationError(MSSQLMCPError):
             value: The invalid value (truncated if too long)
 
         """
-        details: dict[str, str] = {}
-        if parameter:
-            details["parameter"] = parameter
-        if value:
-            details["value"] = str(value)[:100]
         super().__init__(
             message=message,
-            error_code="VALIDATION_ERROR",
-            details=details,
+            details={
+                **({"parameter": parameter} if parameter else {}),
+                **({"value": str(value)[:100]} if value else {}),
+            },
         )
 
 
@@ -173,6 +212,8 @@ class TimeoutError(MSSQLMCPError):
     Raised when a database operation exceeds the configured timeout.
     """
 
+    ERROR_CODE = "TIMEOUT_ERROR"
+
     def __init__(
         self,
         message: str,
@@ -187,18 +228,62 @@ class TimeoutError(MSSQLMCPError):
             timeout_seconds: The configured timeout value
 
         """
-        details: dict[str, str] = {}
-        if operation:
-            details["operation"] = operation
-        if timeout_seconds is not None:
-            details["timeout_seconds"] = str(timeout_seconds)
         super().__init__(
             message=message,
-            error_code="TIMEOUT_ERROR",
-            details=details,
+            details={
+                **({"operation": operation} if operation else {}),
+                **(
+                    {"timeout_seconds": str(timeout_seconds)}
+                    if timeout_seconds is not None
+                    else {}
+                ),
+            },
         )
 
 
+def _get_json() -> _JsonModule:
+    """Return the json module, importing and memoizing it on first use.
+
+    Returns:
+        The json module
+
+    """
+    global _json
+    if _json is None:
+        import json
+
+        _json = json
+    return _json
+
+
+@functools.lru_cache(maxsize=128)
+def _format_cached(
+    error_code: str, message: str, details_key: tuple[tuple[str, str], ...]
+) -> str:
+    """Serialize an error payload, memoizing identical responses.
+
+    Retry storms re-raise the same transient error repeatedly; caching
+    on (code, message, details) skips re-running the JSON encoder.
+
+    Args:
+        error_code: Machine-readable error code
+        message: Human-readable error message
+        details_key: Details dict as a sorted tuple of items
+
+    Returns:
+        JSON string with error details
+
+    """
+    return _get_json().dumps(
+        {
+            "error": error_code,
+            "message": message,
+            "details": dict(details_key),
+        },
+        **_JSON_KWARGS,
+    )
+
+
 def format_error_response(error: Exception) -> str:
     """Format an error as JSON for MCP response.
 
@@ -209,37 +294,74 @@ def format_error_response(error: Exception) -> str:
         JSON string with error details
 
     """
-    import json
-
     if isinstance(error, MSSQLMCPError):
-        return json.dumps(error.to_dict(), indent=2)
+        try:
+            details_key = tuple(sorted(error.details.items()))
+            return _format_cached(error.error_code, error.message, details_key)
+        except TypeError:
+            # Unhashable detail values fall back to direct serialization
+            return _get_json().dumps(error.to_dict(), **_JSON_KWARGS)
 
     # For non-MSSQLMCPError exceptions, create a generic error response
-    return json.dumps(
+    return _get_json().dumps(
         {
             "error": "INTERNAL_ERROR",
             "message": str(error),
             "details": {"type": error.__class__.__name__},
         },
-        indent=2,
+        **_JSON_KWARGS,
     )
 
 
 # Transient error codes that should trigger retry logic
 # Based on pyodbc error codes and SQL Server error numbers
-TRANSIENT_ERROR_CODES = {
-    "08S01",  # Communication link failure
-    "08001",  # Unable to connect to data source
-    "HYT00",  # Timeout expired
-    "HYT01",  # Connection timeout expired
-    "40001",  # Serialization failure (deadlock)
-    "40197",  # SQL Azure: Service temporarily unavailable
-    "40501",  # SQL Azure: Service is busy
-    "40613",  # SQL Azure: Database unavailable
-    "49918",  # SQL Azure: Cannot process request
-    "49919",  # SQL Azure: Cannot process create/update request
-    "49920",  # SQL Azure: Cannot process delete request
-}
+TRANSIENT_ERROR_CODES: frozenset[str] = frozenset(
+    {
+        "08S01",  # Communication link failure
+        "08001",  # Unable to connect to data source
+        "HYT00",  # Timeout expired
+        "HYT01",  # Connection timeout expired
+        "40001",  # Serialization failure (deadlock)
+        "40197",  # SQL Azure: Service temporarily unavailable
+        "40501",  # SQL Azure: Service is busy
+        "40613",  # SQL Azure: Database unavailable
+        "49918",  # SQL Azure: Cannot process request
+        "49919",  # SQL Azure: Cannot process create/update request
+        "49920",  # SQL Azure: Cannot process delete request
+    }
+)
+
+# The same codes as a tuple for the retry-decision hot path: at this
+# size a linear scan with the string-identity shortcut beats computing
+# a hash for every set probe.
+_HOT_TRANSIENT_CODES: tuple[str, ...] = (
+    "08S01",
+    "08001",
+    "HYT00",
+    "HYT01",
+    "40001",
+    "40197",
+    "40501",
+    "40613",
+    "49918",
+    "49919",
+    "49920",
+)
+
+# Guard against the two collections drifting apart when codes are added
+assert set(_HOT_TRANSIENT_CODES) == TRANSIENT_ERROR_CODES  # noqa: S101
+
+
+# Exception classes worth running through transient classification at
+# all. Retry loops catch only these, so non-database errors (TypeError,
+# KeyError, typed MCP errors) propagate without touching the retry
+# machinery. Transience itself is a property of the SQLSTATE, not the
+# exception class, so the tuple stays at pyodbc's base Error and
+# is_transient_error makes the final call. Empty when pyodbc is
+# unavailable -- ``except ()`` catches nothing.
+TRANSIENT_EXCEPTIONS: tuple[type[Exception], ...] = (
+    (_pyodbc.Error,) if _pyodbc is not None else ()
+)
 
 
 def is_transient_error(error: Exception) -> bool:
@@ -252,14 +374,11 @@ def is_transient_error(error: Exception) -> bool:
         True if error is transient, False otherwise
 
     """
-    import pyodbc
-
-    if not isinstance(error, pyodbc.Error):
+    if _pyodbc is None or not isinstance(error, _pyodbc.Error):
         return False
 
-    # Check if error code is in transient list
-    if hasattr(error, "args") and len(error.args) > 0:
-        error_code = str(error.args[0])
-        return error_code in TRANSIENT_ERROR_CODES
-
-    return False
+    # pyodbc's SQLSTATE is already a 5-char str, so compare args[0]
+    # directly instead of allocating a str() copy
+    args = error.args
+    code = args[0] if args else None
+    return code is not None and code in _HOT_TRANSIENT_CODES
@@ -1,11 +1,17 @@
 """Health check functionality for MSSQL MCP Server."""
 
+import functools
 import logging
+import sys
 
 import pyodbc
 
 from mssql_mcp_server.config import ServerConfig
 
+# Match server.py: driver-level pooling is only reliable on Windows, and
+# must be set before the first connection is opened.
+pyodbc.pooling = sys.platform == "win32"
+
 logger = logging.getLogger("mssql_mcp_server.health")
 
 
@@ -15,6 +21,28 @@ class HealthCheckError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=4)
+def _build_conn_str(driver: str, server: str, database: str) -> str:
+    """Build an ODBC connection string, memoized on its inputs.
+
+    Args:
+        driver: ODBC driver name
+        server: SQL Server hostname
+        database: Target database name
+
+    Returns:
+        ODBC connection string using Windows Authentication
+
+    """
+    return (
+        f"DRIVER={{{driver}}};"
+        f"SERVER={server};"
+        f"DATABASE={database};"
+        f"Trusted_Connection=yes;"
+        f"TrustServerCertificate=yes;"
+    )
+
+
 def check_database_connection(config: ServerConfig) -> dict[str, str]:
     """Test database connection and retrieve basic information.
 
@@ -28,33 +56,24 @@ def check_database_connection(config: ServerConfig) -> dict[str, str]:
         HealthCheckError: If connection fails
 
     """
-    conn_str = (
-        f"DRIVER={{{config.driver}}};"
-        f"SERVER={config.server};"
-        f"DATABASE={config.database};"
-        f"Trusted_Connection=yes;"
-        f"TrustServerCertificate=yes;"
-    )
+    conn_str = _build_conn_str(config.driver, config.server, config.database)
 
     try:
         conn = pyodbc.connect(conn_str, timeout=config.connection_timeout)
         try:
             cursor = conn.cursor()
 
-            # Get SQL Server version
-            cursor.execute("SELECT @@VERSION AS version")
-            version_row = cursor.fetchone()
-            version = version_row.version if version_row else "Unknown"
-
-            # Get database name (verify we're connected to the right database)
-            cursor.execute("SELECT DB_NAME() AS database_name")
-            db_row = cursor.fetchone()
-            database_name = db_row.database_name if db_row else "Unknown"
-
-            # Get server name
-            cursor.execute("SELECT @@SERVERNAME AS server_name")
-            server_row = cursor.fetchone()
-            server_name = server_row.server_name if server_row else "Unknown"
+            # Fetch version, database name, and server name in a single
+            # round trip instead of three separate queries.
+            cursor.execute(
+                "SELECT @@VERSION AS version, "
+                "DB_NAME() AS database_name, "
+                "@@SERVERNAME AS server_name"
+            )
+            row = cursor.fetchone()
+            version = row.version if row else "Unknown"
+            database_name = row.database_name if row else "Unknown"
+            server_name = row.server_name if row else "Unknown"
 
             return {
                 "status": "healthy",
@@ -1,1404 +1,2263 @@
-#!/usr/bin/env python3
-"""MSSQL MCP Server - Read-Only Access to SQL Server via Windows Authentication.
-
-A Model Context Protocol (MCP) server that provides safe, read-only access to
-Microsoft SQL Server databases using Windows Authentication (Trusted Connection).
-
-Built for environments where:
-- Windows Authentication is required (no username/password)
-- Read-only access is mandated by IT policy
-- SQL Server is accessed from Windows workstations
-
-Features:
-- Windows Authentication via pyodbc Trusted_Connection
-- Read-only by design: Only SELECT queries allowed
-- Security filtering: Blocks INSERT, UPDATE, DELETE, DROP, etc.
-- Row limiting: Prevents accidental large result sets
-- Async non-blocking architecture
-- Per-request connections (thread-safe by design)
-- MCP Resources for schema discovery
-
-Thread Safety:
-pyodbc reports threadsafety=1 (PEP 249), meaning threads may share the module
-but not connections. This server creates fresh connections per-request within
-worker threads, ensuring connections are never shared across threads. Windows
-ODBC Driver handles connection pooling at the driver level transparently.
-
-Environment Variables:
-- MSSQL_SERVER: SQL Server hostname (default: localhost)
-- MSSQL_DATABASE: Database name (default: master)
-- ODBC_DRIVER: ODBC driver name (default: ODBC Driver 17 for SQL Server)
-
-Author: Jack Jones
-License: MIT
-"""
-
-import json
-import logging
-import os
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
-from typing import TYPE_CHECKING, Any
-
-import anyio
-import pyodbc
-from fastmcp import FastMCP
-
-from mssql_mcp_server.errors import (
-    ConnectionError as MSSQLConnectionError,
-)
-from mssql_mcp_server.errors import (
-    SecurityError,
-    ValidationError,
-    format_error_response,
-)
-
-if TYPE_CHECKING:
-    from mssql_mcp_server.config import ServerConfig
-
-# Configure logging
-logger = logging.getLogger("mssql_mcp_server")
-
-# Global configuration (loaded at startup)
-# Will be initialized in main() or when imported
-_config: "ServerConfig | None" = None
-
-# Legacy environment variable support (will be removed in v1.0.0)
-MSSQL_SERVER = os.environ.get("MSSQL_SERVER", "localhost")
-MSSQL_DATABASE = os.environ.get("MSSQL_DATABASE", "master")
-ODBC_DRIVER = os.environ.get("ODBC_DRIVER", "ODBC Driver 17 for SQL Server")
-CONNECTION_TIMEOUT = int(os.environ.get("MSSQL_CONNECTION_TIMEOUT", "30"))
-
-
-def set_config(config: "ServerConfig") -> None:
-    """Set global server configuration.
-
-    Args:
-        config: Server configuration to use
-
-    """
-    global _config
-    _config = config
-
-
-def get_config() -> tuple[str, str, str, int, int, int, float]:
-    """Get current configuration values.
-
-    Returns:
-        Tuple of (server, database, driver, connection_timeout, query_timeout, max_retries, retry_delay)
-
-    """
-    if _config:
-        return (
-            _config.server,
-            _config.database,
-            _config.driver,
-            _config.connection_timeout,
-            _config.query_timeout,
-            _config.max_retries,
-            _config.retry_delay,
-        )
-    # Fall back to environment variables
-    return (MSSQL_SERVER, MSSQL_DATABASE, ODBC_DRIVER, CONNECTION_TIMEOUT, 30, 3, 1.0)
-
-
-def create_connection() -> pyodbc.Connection:
-    """Create a new database connection.
-
-    Creates a fresh connection using Windows Authentication.
-    Windows ODBC Driver handles connection pooling at the driver level,
-    so we don't need application-level pooling.
-
-    Returns:
-        Database connection
-
-    Raises:
-        MSSQLConnectionError: If connection fails
-
-    """
-    server, database, driver, connection_timeout, query_timeout, _, _ = get_config()
-    conn_str = (
-        f"DRIVER={{{driver}}};"
-        f"SERVER={server};"
-        f"DATABASE={database};"
-        f"Trusted_Connection=yes;"
-        f"TrustServerCertificate=yes;"
-    )
-
-    try:
-        conn = pyodbc.connect(conn_str, timeout=connection_timeout)
-        # Set query timeout on the connection
-        conn.timeout = query_timeout
-        return conn
-    except pyodbc.Error as e:
-        error_msg = str(e)
-        logger.error(f"Database connection failed: {error_msg}")
-        raise MSSQLConnectionError(
-            message=f"Failed to connect to SQL Server: {error_msg}",
-            details={
-                "server": server,
-                "database": database,
-                "driver": driver,
-            },
-        ) from e
-
-
-@asynccontextmanager
-async def lifespan(server: FastMCP) -> AsyncIterator[dict[str, Any]]:
-    """Lifespan context manager for server startup/shutdown.
-
-    Logs server initialization and cleanup. Connection pooling is handled
-    transparently by the Windows ODBC Driver at the driver level.
-    """
-    server_name, database, _, _, _, _, _ = get_config()
-    logger.info(f"Starting MSSQL MCP Server: server={server_name}, database={database}")
-    logger.info(
-        "Using per-request connections (ODBC driver handles pooling at driver level)"
-    )
-
-    yield {"server": server_name, "database": database}
-
-    logger.info("Shutting down MSSQL MCP Server")
-
-
-# Create FastMCP server with lifespan
-mcp: FastMCP = FastMCP("mssql-readonly", lifespan=lifespan)
-
-
-async def run_in_thread(func: Any, *args: Any, **kwargs: Any) -> Any:
-    """Run a blocking function in a thread pool."""
-    return await anyio.to_thread.run_sync(lambda: func(*args, **kwargs))
-
-
-def retry_with_backoff(func: Any, *args: Any, **kwargs: Any) -> Any:
-    """Retry a function with exponential backoff for transient errors.
-
-    Args:
-        func: The function to retry (must be a sync function)
-        *args: Positional arguments for the function
-        **kwargs: Keyword arguments for the function
-
-    Returns:
-        The function result
-
-    Raises:
-        The last exception if all retries are exhausted
-
-    """
-    import time
-
-    from mssql_mcp_server.errors import is_transient_error
-
-    _, _, _, _, _, max_retries, retry_delay = get_config()
-
-    last_exception = None
-    for attempt in range(max_retries + 1):
-        try:
-            return func(*args, **kwargs)
-        except Exception as e:
-            last_exception = e
-            if not is_transient_error(e) or attempt >= max_retries:
-                raise
-            # Calculate exponential backoff delay
-            delay = retry_delay * (2**attempt)
-            logger.warning(
-                f"Transient error on attempt {attempt + 1}/{max_retries + 1}: {e}. "
-                f"Retrying in {delay:.1f}s..."
-            )
-            time.sleep(delay)
-
-    # This should never be reached, but for type safety
-    if last_exception:
-        raise last_exception
-    raise RuntimeError("Retry loop exited unexpectedly")
-
-
-def handle_tool_errors(func: Any) -> Any:
-    """Handle errors in MCP tools and return consistent error responses.
-
-    Args:
-        func: The async function to wrap
-
-    Returns:
-        Wrapped function that catches errors and returns formatted JSON
-
-    """
-    import functools
-
-    @functools.wraps(func)
-    async def wrapper(*args: Any, **kwargs: Any) -> str:
-        """Wrap tool call with error handling."""
-        try:
-            result = await func(*args, **kwargs)
-            return str(result)  # Ensure string return type
-        except Exception as e:
-            logger.error(f"Error in {func.__name__}: {e}")
-            return format_error_response(e)
-
-    return wrapper
-
-
-# =============================================================================
-# MCP Tools
-# =============================================================================
-
-
-@mcp.tool()
-@handle_tool_errors
-async def ListTables(schema_filter: str | None = None) -> str:
-    """List all tables in the SQL Server database.
-
-    Args:
-        schema_filter: Optional schema name to filter tables (e.g., 'dbo')
-
-    Returns:
-        JSON string with database info and table list
-
-    """
-    logger.debug(f"ListTables called with schema_filter={schema_filter}")
-
-    def _query() -> list[str]:
-        """Execute query with per-request connection (thread-safe)."""
-        conn = create_connection()
-        try:
-            cursor = conn.cursor()
-            query = """
-                SELECT TABLE_SCHEMA, TABLE_NAME
-                FROM INFORMATION_SCHEMA.TABLES
-                WHERE TABLE_TYPE = 'BASE TABLE'
-            """
-            if schema_filter:
-                query += " AND TABLE_SCHEMA = ?"
-                cursor.execute(query, (schema_filter,))
-            else:
-                query += " ORDER BY TABLE_SCHEMA, TABLE_NAME"
-                cursor.execute(query)
-
-            tables = []
-            for row in cursor.fetchall():
-                tables.append(f"{row.TABLE_SCHEMA}.{row.TABLE_NAME}")
-            return tables
-        finally:
-            conn.close()
-
-    # Run query with retry logic for transient errors
-    tables = await run_in_thread(retry_with_backoff, _query)
-
-    result: dict[str, Any] = {
-        "database": MSSQL_DATABASE,
-        "server": MSSQL_SERVER,
-        "table_count": len(tables),
-        "tables": tables[:500],
-    }
-
-    if len(tables) > 500:
-        result["note"] = (
-            f"Showing first 500 of {len(tables)} tables. "
-            "Use schema_filter to narrow results."
-        )
-
-    logger.debug(f"Found {len(tables)} tables")
-    return json.dumps(result, indent=2)
-
-
-@mcp.tool()
-@handle_tool_errors
-async def DescribeTable(table_name: str) -> str:
-    """Return the schema/structure of a specific table.
-
-    Args:
-        table_name: Name of the table (can include schema, e.g., 'dbo.oe_hdr')
-
-    Returns:
-        JSON string with column definitions
-
-    Raises:
-        ValidationError: If table_name is empty
-
-    """
-    logger.debug(f"DescribeTable called for {table_name}")
-
-    # Parse schema.table format
-    if "." in table_name:
-        schema, table = table_name.split(".", 1)
-    else:
-        schema = "dbo"
-        table = table_name
-
-    def _query() -> list[dict[str, Any]]:
-        """Execute query with per-request connection (thread-safe)."""
-        conn = create_connection()
-        try:
-            cursor = conn.cursor()
-
-            # Get column information
-            query = """
-                SELECT
-                    COLUMN_NAME,
-                    DATA_TYPE,
-                    CHARACTER_MAXIMUM_LENGTH,
-                    NUMERIC_PRECISION,
-                    NUMERIC_SCALE,
-                    IS_NULLABLE,
-                    COLUMN_DEFAULT
-                FROM INFORMATION_SCHEMA.COLUMNS
-                WHERE TABLE_SCHEMA = ? AND TABLE_NAME = ?
-                ORDER BY ORDINAL_POSITION
-            """
-            cursor.execute(query, (schema, table))
-
-            columns = []
-            for row in cursor.fetchall():
-                col: dict[str, Any] = {
-                    "name": row.COLUMN_NAME,
-                    "type": row.DATA_TYPE,
-                    "nullable": row.IS_NULLABLE == "YES",
-                }
-                if row.CHARACTER_MAXIMUM_LENGTH:
-                    col["max_length"] = row.CHARACTER_MAXIMUM_LENGTH
-                if row.NUMERIC_PRECISION:
-                    col["precision"] = row.NUMERIC_PRECISION
-                    col["scale"] = row.NUMERIC_SCALE
-                if row.COLUMN_DEFAULT:
-                    col["default"] = row.COLUMN_DEFAULT
-                columns.append(col)
-
-            # Get primary key columns
-            pk_query = """
-                SELECT COLUMN_NAME
-                FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
-                WHERE TABLE_SCHEMA = ?
-                  AND TABLE_NAME = ?
-                  AND CONSTRAINT_NAME IN (
-                      SELECT CONSTRAINT_NAME
-                      FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS
-                      WHERE TABLE_SCHEMA = ?
-                        AND TABLE_NAME = ?
-                        AND CONSTRAINT_TYPE = 'PRIMARY KEY'
-                  )
-            """
-            cursor.execute(pk_query, (schema, table, schema, table))
-            pk_columns = {row.COLUMN_NAME for row in cursor.fetchall()}
-
-            # Get foreign key columns
-            fk_query = """
-                SELECT
-                    COL_NAME(fkc.parent_object_id, fkc.parent_column_id) AS column_name,
-                    OBJECT_SCHEMA_NAME(fkc.referenced_object_id) AS ref_schema,
-                    OBJECT_NAME(fkc.referenced_object_id) AS ref_table,
-                    COL_NAME(fkc.referenced_object_id, fkc.referenced_column_id) AS ref_column
-                FROM sys.foreign_key_columns fkc
-                WHERE OBJECT_SCHEMA_NAME(fkc.parent_object_id) = ?
-                  AND OBJECT_NAME(fkc.parent_object_id) = ?
-            """
-            cursor.execute(fk_query, (schema, table))
-            fk_map = {
-                row.column_name: {
-                    "references_table": f"{row.ref_schema}.{row.ref_table}",
-                    "references_column": row.ref_column,
-                }
-                for row in cursor.fetchall()
-            }
-
-            # Add PK and FK indicators to columns
-            for col in columns:
-                col["is_primary_key"] = col["name"] in pk_columns
-                if col["name"] in fk_map:
-                    col["foreign_key"] = fk_map[col["name"]]
-
-            return columns
-        finally:
-            conn.close()
-
-    columns = await run_in_thread(_query)
-
-    if not columns:
-        return json.dumps(
-            {"error": f"Table '{table_name}' not found or has no columns."}
-        )
-
-    result = {
-        "table": f"{schema}.{table}",
-        "column_count": len(columns),
-        "columns": columns,
-    }
-
-    logger.debug(f"Found {len(columns)} columns for {table_name}")
-    return json.dumps(result, indent=2)
-
-
-@mcp.tool()
-@handle_tool_errors
-async def ReadData(query: str, max_rows: int = 100) -> str:
-    """Execute a SELECT query and return results. Only SELECT statements allowed.
-
-    Args:
-        query: SQL SELECT query to execute
-        max_rows: Maximum rows to return (default: 100, max: 1000)
-
-    Returns:
-        JSON string with query results
-
-    Raises:
-        ValidationError: If max_rows is invalid
-        SecurityError: If query is not a SELECT or contains dangerous keywords
-
-    """
-    logger.debug(f"ReadData called with max_rows={max_rows}")
-
-    # Validate max_rows parameter
-    if max_rows <= 0:
-        raise ValidationError(
-            message="max_rows must be positive",
-            parameter="max_rows",
-            value=str(max_rows),
-        )
-
-    # Security: Only allow SELECT statements
-    query_upper = query.strip().upper()
-    if not query_upper.startswith("SELECT"):
-        logger.warning("Blocked non-SELECT query attempt")
-        raise SecurityError(
-            message="Only SELECT queries are allowed. This server is read-only.",
-            query=query,
-            blocked_keyword="non-SELECT statement",
-        )
-
-    # Block dangerous keywords that could appear in subqueries or CTEs
-    dangerous = [
-        "INSERT",
-        "UPDATE",
-        "DELETE",
-        "DROP",
-        "CREATE",
-        "ALTER",
-        "EXEC",
-        "EXECUTE",
-        "TRUNCATE",
-        "GRANT",
-        "REVOKE",
-        "DENY",
-        "BACKUP",
-        "RESTORE",
-        "SHUTDOWN",
-        "DBCC",
-    ]
-    for keyword in dangerous:
-        # Check for keyword as whole word (not part of column name)
-        if f" {keyword} " in f" {query_upper} " or f" {keyword}(" in f" {query_upper} ":
-            logger.warning(f"Blocked query with forbidden keyword: {keyword}")
-            raise SecurityError(
-                message=f"Query contains forbidden keyword '{keyword}'. This server is read-only.",
-                query=query,
-                blocked_keyword=keyword,
-            )
-
-    # Limit rows
-    max_rows = min(max_rows, 1000)
-
-    def _execute() -> tuple[list[str], list[dict[str, str | None]]]:
-        """Execute query with per-request connection (thread-safe)."""
-        conn = create_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute(query)
-
-            # Get column names
-            columns = [desc[0] for desc in cursor.description]
-
-            # Fetch limited rows
-            rows: list[dict[str, str | None]] = []
-            for i, row in enumerate(cursor):
-                if i >= max_rows:
-                    break
-                # Convert all values to strings for JSON serialization
-                row_dict: dict[str, str | None] = {}
-                for col, val in zip(columns, row, strict=True):
-                    if val is None:
-                        row_dict[col] = None
-                    elif isinstance(val, bytes | bytearray):
-                        row_dict[col] = val.hex()  # Convert binary to hex string
-                    else:
-                        row_dict[col] = str(val)
-                rows.append(row_dict)
-            return columns, rows
-        finally:
-            conn.close()
-
-    try:
-        columns, rows = await run_in_thread(_execute)
-    except pyodbc.Error as e:
-        logger.error(f"Database error: {e!s}")
-        return json.dumps({"error": f"Database Error: {e!s}"})
-
-    result: dict[str, Any] = {
-        "columns": columns,
-        "row_count": len(rows),
-        "max_rows": max_rows,
-        "data": rows,
-    }
-
-    if len(rows) == max_rows:
-        result["note"] = (
-            f"Results limited to {max_rows} rows. "
-            "Increase max_rows or add WHERE clause."
-        )
-
-    logger.debug(f"Query returned {len(rows)} rows")
-    return json.dumps(result, indent=2)
-
-
-@mcp.tool()
-@handle_tool_errors
-async def ListViews(schema_filter: str | None = None) -> str:
-    """List all views in the SQL Server database.
-
-    Args:
-        schema_filter: Optional schema name to filter views (e.g., 'dbo')
-
-    Returns:
-        JSON string with database info and view list
-
-    """
-    logger.debug(f"ListViews called with schema_filter={schema_filter}")
-
-    def _query() -> list[str]:
-        """Execute query with per-request connection (thread-safe)."""
-        conn = create_connection()
-        try:
-            cursor = conn.cursor()
-            query = """
-                SELECT TABLE_SCHEMA, TABLE_NAME
-                FROM INFORMATION_SCHEMA.VIEWS
-            """
-            if schema_filter:
-                query += " WHERE TABLE_SCHEMA = ?"
-                cursor.execute(query, (schema_filter,))
-            else:
-                query += " ORDER BY TABLE_SCHEMA, TABLE_NAME"
-                cursor.execute(query)
-
-            views = []
-            for row in cursor.fetchall():
-                views.append(f"{row.TABLE_SCHEMA}.{row.TABLE_NAME}")
-            return views
-        finally:
-            conn.close()
-
-    views = await run_in_thread(_query)
-
-    result: dict[str, Any] = {
-        "database": MSSQL_DATABASE,
-        "server": MSSQL_SERVER,
-        "view_count": len(views),
-        "views": views[:500],
-    }
-
-    if len(views) > 500:
-        result["note"] = (
-            f"Showing first 500 of {len(views)} views. "
-            "Use schema_filter to narrow results."
-        )
-
-    logger.debug(f"Found {len(views)} views")
-    return json.dumps(result, indent=2)
-
-
-@mcp.tool()
-@handle_tool_errors
-async def GetTableRelationships(table_name: str) -> str:
-    """Return foreign key relationships for a specific table.
-
-    Args:
-        table_name: Name of the table (can include schema, e.g., 'dbo.oe_hdr')
-
-    Returns:
-        JSON string with incoming and outgoing foreign key relationships including:
-        - Constraint names
-        - Column mappings (supports composite foreign keys)
-        - Referential actions (ON DELETE, ON UPDATE)
-        - Enabled/disabled status
-        - Full schema-qualified table names
-
-    """
-    logger.debug(f"GetTableRelationships called for {table_name}")
-
-    # Parse schema.table format
-    if "." in table_name:
-        schema, table = table_name.split(".", 1)
-    else:
-        schema = "dbo"
-        table = table_name
-
-    def _query() -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-        """Execute query with per-request connection (thread-safe)."""
-        conn = create_connection()
-        try:
-            cursor = conn.cursor()
-
-            # Get outgoing FKs (this table references others)
-            outgoing_query = """
-                SELECT
-                    fk.name AS constraint_name,
-                    OBJECT_SCHEMA_NAME(fk.referenced_object_id) AS referenced_schema,
-                    OBJECT_NAME(fk.referenced_object_id) AS referenced_table,
-                    COL_NAME(fkc.parent_object_id, fkc.parent_column_id) AS column_name,
-                    COL_NAME(fkc.referenced_object_id, fkc.referenced_column_id) AS referenced_column,
-                    fk.delete_referential_action_desc AS on_delete,
-                    fk.update_referential_action_desc AS on_update,
-                    fk.is_disabled,
-                    fkc.constraint_column_id
-                FROM sys.foreign_keys fk
-                JOIN sys.foreign_key_columns fkc ON fk.object_id = fkc.constraint_object_id
-                WHERE OBJECT_NAME(fk.parent_object_id) = ?
-                  AND OBJECT_SCHEMA_NAME(fk.parent_object_id) = ?
-                ORDER BY fk.name, fkc.constraint_column_id
-            """
-            cursor.execute(outgoing_query, (table, schema))
-
-            # Group outgoing FKs by constraint (for composite FKs)
-            outgoing_raw = cursor.fetchall()
-            outgoing_map: dict[str, dict[str, Any]] = {}
-            for row in outgoing_raw:
-                if row.constraint_name not in outgoing_map:
-                    outgoing_map[row.constraint_name] = {
-                        "constraint": row.constraint_name,
-                        "columns": [],
-                        "references_table": f"{row.referenced_schema}.{row.referenced_table}",
-                        "references_columns": [],
-                        "on_delete": row.on_delete,
-                        "on_update": row.on_update,
-                        "is_disabled": bool(row.is_disabled),
-                    }
-                outgoing_map[row.constraint_name]["columns"].append(row.column_name)
-                outgoing_map[row.constraint_name]["references_columns"].append(
-                    row.referenced_column
-                )
-
-            outgoing = list(outgoing_map.values())
-
-            # Get incoming FKs (other tables reference this one)
-            incoming_query = """
-                SELECT
-                    fk.name AS constraint_name,
-                    OBJECT_SCHEMA_NAME(fk.parent_object_id) AS referencing_schema,
-                    OBJECT_NAME(fk.parent_object_id) AS referencing_table,
-                    COL_NAME(fkc.parent_object_id, fkc.parent_column_id) AS referencing_column,
-                    COL_NAME(fkc.referenced_object_id, fkc.referenced_column_id) AS referenced_column,
-                    fk.delete_referential_action_desc AS on_delete,
-                    fk.update_referential_action_desc AS on_update,
-                    fk.is_disabled,
-                    fkc.constraint_column_id
-                FROM sys.foreign_keys fk
-                JOIN sys.foreign_key_columns fkc ON fk.object_id = fkc.constraint_object_id
-                WHERE OBJECT_NAME(fk.referenced_object_id) = ?
-                  AND OBJECT_SCHEMA_NAME(fk.referenced_object_id) = ?
-                ORDER BY fk.name, fkc.constraint_column_id
-            """
-            cursor.execute(incoming_query, (table, schema))
-
-            # Group incoming FKs by constraint (for composite FKs)
-            incoming_raw = cursor.fetchall()
-            incoming_map: dict[str, dict[str, Any]] = {}
-            for row in incoming_raw:
-                if row.constraint_name not in incoming_map:
-                    incoming_map[row.constraint_name] = {
-                        "constraint": row.constraint_name,
-                        "from_table": f"{row.referencing_schema}.{row.referencing_table}",
-                        "from_columns": [],
-                        "to_columns": [],
-                        "on_delete": row.on_delete,
-                        "on_update": row.on_update,
-                        "is_disabled": bool(row.is_disabled),
-                    }
-                incoming_map[row.constraint_name]["from_columns"].append(
-                    row.referencing_column
-                )
-                incoming_map[row.constraint_name]["to_columns"].append(
-                    row.referenced_column
-                )
-
-            incoming = list(incoming_map.values())
-            return outgoing, incoming
-        finally:
-            conn.close()
-
-    outgoing, incoming = await run_in_thread(_query)
-
-    result = {
-        "table": f"{schema}.{table}",
-        "outgoing_relationships": outgoing,
-        "incoming_relationships": incoming,
-        "outgoing_count": len(outgoing),
-        "incoming_count": len(incoming),
-    }
-
-    logger.debug(
-        f"Found {len(outgoing)} outgoing, {len(incoming)} incoming relationships"
-    )
-    return json.dumps(result, indent=2)
-
-
-@mcp.tool()
-@handle_tool_errors
-async def ListIndexes(table_name: str) -> str:
-    """List indexes defined on a table with columns and types.
-
-    Args:
-        table_name: Table name (can include schema, e.g., 'dbo.customers')
-
-    Returns:
-        JSON string with index definitions including columns and types
-
-    """
-    logger.debug(f"ListIndexes called for {table_name}")
-
-    # Parse schema.table format
-    if "." in table_name:
-        schema, table = table_name.split(".", 1)
-    else:
-        schema = "dbo"
-        table = table_name
-
-    def _query() -> list[dict[str, Any]]:
-        """Execute query with per-request connection (thread-safe)."""
-        conn = create_connection()
-        try:
-            cursor = conn.cursor()
-            query = """
-                SELECT
-                    i.name AS index_name,
-                    i.type_desc AS index_type,
-                    i.is_unique,
-                    i.is_primary_key,
-                    STRING_AGG(c.name, ', ') WITHIN GROUP (ORDER BY ic.key_ordinal) AS columns
-                FROM sys.indexes i
-                JOIN sys.index_columns ic ON i.object_id = ic.object_id AND i.index_id = ic.index_id
-                JOIN sys.columns c ON ic.object_id = c.object_id AND ic.column_id = c.column_id
-                WHERE i.object_id = OBJECT_ID(?)
-                  AND i.name IS NOT NULL
-                GROUP BY i.name, i.type_desc, i.is_unique, i.is_primary_key
-                ORDER BY i.is_primary_key DESC, i.name
-            """
-            cursor.execute(query, (f"{schema}.{table}",))
-
-            indexes = []
-            for row in cursor.fetchall():
-                indexes.append(
-                    {
-                        "name": row.index_name,
-                        "type": row.index_type,
-                        "is_unique": bool(row.is_unique),
-                        "is_primary_key": bool(row.is_primary_key),
-                        "columns": row.columns,
-                    }
-                )
-            return indexes
-        finally:
-            conn.close()
-
-    indexes = await run_in_thread(_query)
-
-    result = {
-        "table": f"{schema}.{table}",
-        "index_count": len(indexes),
-        "indexes": indexes,
-    }
-
-    logger.debug(f"Found {len(indexes)} indexes for {table_name}")
-    return json.dumps(result, indent=2)
-
-
-@mcp.tool()
-@handle_tool_errors
-async def ListConstraints(table_name: str) -> str:
-    """List constraints defined on a table (CHECK, UNIQUE, DEFAULT).
-
-    Args:
-        table_name: Table name (can include schema, e.g., 'dbo.orders')
-
-    Returns:
-        JSON string with constraint definitions
-
-    """
-    logger.debug(f"ListConstraints called for {table_name}")
-
-    # Parse schema.table format
-    if "." in table_name:
-        schema, table = table_name.split(".", 1)
-    else:
-        schema = "dbo"
-        table = table_name
-
-    def _query() -> list[dict[str, Any]]:
-        """Execute query with per-request connection (thread-safe)."""
-        conn = create_connection()
-        try:
-            cursor = conn.cursor()
-
-            # Query for CHECK and UNIQUE constraints
-            constraints_query = """
-                SELECT
-                    tc.CONSTRAINT_NAME,
-                    tc.CONSTRAINT_TYPE,
-                    COALESCE(ccu.COLUMN_NAME, '') AS COLUMN_NAME,
-                    COALESCE(cc.CHECK_CLAUSE, '') AS CHECK_CLAUSE
-                FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
-                LEFT JOIN INFORMATION_SCHEMA.CONSTRAINT_COLUMN_USAGE ccu
-                    ON tc.CONSTRAINT_NAME = ccu.CONSTRAINT_NAME
-                    AND tc.TABLE_SCHEMA = ccu.TABLE_SCHEMA
-                    AND tc.TABLE_NAME = ccu.TABLE_NAME
-                LEFT JOIN INFORMATION_SCHEMA.CHECK_CONSTRAINTS cc
-                    ON tc.CONSTRAINT_NAME = cc.CONSTRAINT_NAME
-                WHERE tc.TABLE_SCHEMA = ?
-                  AND tc.TABLE_NAME = ?
-                  AND tc.CONSTRAINT_TYPE IN ('CHECK', 'UNIQUE')
-                ORDER BY tc.CONSTRAINT_TYPE, tc.CONSTRAINT_NAME
-            """
-            cursor.execute(constraints_query, (schema, table))
-
-            constraints = []
-            for row in cursor.fetchall():
-                constraint: dict[str, Any] = {
-                    "name": row.CONSTRAINT_NAME,
-                    "type": row.CONSTRAINT_TYPE,
-                }
-                if row.COLUMN_NAME:
-                    constraint["column"] = row.COLUMN_NAME
-                if row.CHECK_CLAUSE:
-                    constraint["definition"] = row.CHECK_CLAUSE
-
-                constraints.append(constraint)
-
-            # Query for DEFAULT constraints
-            default_query = """
-                SELECT
-                    dc.name AS constraint_name,
-                    c.name AS column_name,
-                    dc.definition AS default_value
-                FROM sys.default_constraints dc
-                JOIN sys.columns c ON dc.parent_object_id = c.object_id
-                    AND dc.parent_column_id = c.column_id
-                WHERE OBJECT_SCHEMA_NAME(dc.parent_object_id) = ?
-                  AND OBJECT_NAME(dc.parent_object_id) = ?
-                ORDER BY c.name
-            """
-            cursor.execute(default_query, (schema, table))
-
-            for row in cursor.fetchall():
-                constraints.append(
-                    {
-                        "name": row.constraint_name,
-                        "type": "DEFAULT",
-                        "column": row.column_name,
-                        "definition": row.default_value,
-                    }
-                )
-
-            return constraints
-        finally:
-            conn.close()
-
-    constraints = await run_in_thread(_query)
-
-    result = {
-        "table": f"{schema}.{table}",
-        "constraint_count": len(constraints),
-        "constraints": constraints,
-    }
-
-    logger.debug(f"Found {len(constraints)} constraints for {table_name}")
-    return json.dumps(result, indent=2)
-
-
-@mcp.tool()
-@handle_tool_errors
-async def ListStoredProcedures(schema_filter: str | None = None) -> str:
-    """List stored procedures in the database with parameter information.
-
-    Args:
-        schema_filter: Optional schema to filter (e.g., 'dbo')
-
-    Returns:
-        JSON string with stored procedure names and parameter info
-
-    """
-    logger.debug(f"ListStoredProcedures called with schema_filter={schema_filter}")
-
-    def _query() -> list[dict[str, Any]]:
-        """Execute query with per-request connection (thread-safe)."""
-        conn = create_connection()
-        try:
-            cursor = conn.cursor()
-            query = """
-                SELECT
-                    SCHEMA_NAME(p.schema_id) AS schema_name,
-                    p.name AS procedure_name,
-                    p.create_date,
-                    p.modify_date,
-                    STUFF((
-                        SELECT ', ' + par.name + ' ' + TYPE_NAME(par.user_type_id)
-                        FROM sys.parameters par
-                        WHERE par.object_id = p.object_id
-                        ORDER BY par.parameter_id
-                        FOR XML PATH('')
-                    ), 1, 2, '') AS parameters
-                FROM sys.procedures p
-                WHERE SCHEMA_NAME(p.schema_id) = COALESCE(?, SCHEMA_NAME(p.schema_id))
-                ORDER BY schema_name, procedure_name
-            """
-            if schema_filter:
-                cursor.execute(query, (schema_filter,))
-            else:
-                cursor.execute(query, (None,))
-
-            procedures = []
-            for row in cursor.fetchall():
-                proc: dict[str, Any] = {
-                    "schema": row.schema_name,
-                    "name": row.procedure_name,
-                    "full_name": f"{row.schema_name}.{row.procedure_name}",
-                }
-                if row.parameters:
-                    proc["parameters"] = row.parameters
-                else:
-                    proc["parameters"] = None
-
-                procedures.append(proc)
-
-            return procedures
-        finally:
-            conn.close()
-
-    procedures = await run_in_thread(_query)
-
-    result: dict[str, Any] = {
-        "database": MSSQL_DATABASE,
-        "server": MSSQL_SERVER,
-        "procedure_count": len(procedures),
-        "procedures": procedures[:500],
-    }
-
-    if schema_filter:
-        result["schema_filter"] = schema_filter
-
-    if len(procedures) > 500:
-        result["note"] = (
-            f"Showing first 500 of {len(procedures)} procedures. "
-            "Use schema_filter to narrow results."
-        )
-
-    logger.debug(f"Found {len(procedures)} stored procedures")
-    return json.dumps(result, indent=2)
-
-
-@mcp.tool()
-@handle_tool_errors
-async def ListFunctions(schema_filter: str | None = None) -> str:
-    """List user-defined functions in the database with parameter information.
-
-    Args:
-        schema_filter: Optional schema to filter (e.g., 'dbo')
-
-    Returns:
-        JSON string with function names, types, and parameter info
-
-    """
-    logger.debug(f"ListFunctions called with schema_filter={schema_filter}")
-
-    def _query() -> list[dict[str, Any]]:
-        """Execute query with per-request connection (thread-safe)."""
-        conn = create_connection()
-        try:
-            cursor = conn.cursor()
-            query = """
-                SELECT
-                    SCHEMA_NAME(o.schema_id) AS schema_name,
-                    o.name AS function_name,
-                    o.type_desc AS function_type,
-                    STUFF((
-                        SELECT ', ' + par.name + ' ' + TYPE_NAME(par.user_type_id)
-                        FROM sys.parameters par
-                        WHERE par.object_id = o.object_id
-                        ORDER BY par.parameter_id
-                        FOR XML PATH('')
-                    ), 1, 2, '') AS parameters
-                FROM sys.objects o
-                WHERE o.type IN ('FN', 'IF', 'TF')
-                  AND SCHEMA_NAME(o.schema_id) = COALESCE(?, SCHEMA_NAME(o.schema_id))
-                ORDER BY schema_name, function_name
-            """
-            if schema_filter:
-                cursor.execute(query, (schema_filter,))
-            else:
-                cursor.execute(query, (None,))
-
-            functions = []
-            for row in cursor.fetchall():
-                func: dict[str, Any] = {
-                    "schema": row.schema_name,
-                    "name": row.function_name,
-                    "full_name": f"{row.schema_name}.{row.function_name}",
-                    "type": row.function_type,
-                }
-                if row.parameters:
-                    func["parameters"] = row.parameters
-                else:
-                    func["parameters"] = None
-
-                functions.append(func)
-
-            return functions
-        finally:
-            conn.close()
-
-    functions = await run_in_thread(_query)
-
-    result: dict[str, Any] = {
-        "database": MSSQL_DATABASE,
-        "server": MSSQL_SERVER,
-        "function_count": len(functions),
-        "functions": functions[:500],
-    }
-
-    if schema_filter:
-        result["schema_filter"] = schema_filter
-
-    if len(functions) > 500:
-        result["note"] = (
-            f"Showing first 500 of {len(functions)} functions. "
-            "Use schema_filter to narrow results."
-        )
-
-    logger.debug(f"Found {len(functions)} user-defined functions")
-    return json.dumps(result, indent=2)
-
-
-@mcp.tool()
-@handle_tool_errors
-async def ListTriggers(schema_filter: str | None = None) -> str:
-    """List triggers in the database with event and type information.
-
-    Args:
-        schema_filter: Optional schema name to filter triggers (e.g., 'dbo').
-
-    Returns:
-        JSON string containing trigger metadata including name, schema, table,
-        type (AFTER/INSTEAD OF), events (INSERT, UPDATE, DELETE), and enabled status.
-
-    """
-    logger.debug(f"ListTriggers called with schema_filter={schema_filter}")
-
-    def _query() -> list[dict[str, Any]]:
-        """Execute query with per-request connection (thread-safe)."""
-        conn = create_connection()
-        try:
-            cursor = conn.cursor()
-            query = """
-                SELECT
-                    SCHEMA_NAME(o.schema_id) AS schema_name,
-                    tr.name AS trigger_name,
-                    OBJECT_NAME(tr.parent_id) AS table_name,
-                    CASE tr.is_instead_of_trigger
-                        WHEN 1 THEN 'INSTEAD OF'
-                        ELSE 'AFTER'
-                    END AS trigger_type,
-                    tr.is_disabled,
-                    STUFF((
-                        SELECT ', ' + te.type_desc
-                        FROM sys.trigger_events te
-                        WHERE te.object_id = tr.object_id
-                        ORDER BY te.type_desc
-                        FOR XML PATH('')
-                    ), 1, 2, '') AS events
-                FROM sys.triggers tr
-                INNER JOIN sys.objects o ON tr.parent_id = o.object_id
-                WHERE SCHEMA_NAME(o.schema_id) = COALESCE(?, SCHEMA_NAME(o.schema_id))
-                ORDER BY schema_name, trigger_name
-            """
-            if schema_filter:
-                cursor.execute(query, (schema_filter,))
-            else:
-                cursor.execute(query, (None,))
-
-            triggers = []
-            for row in cursor.fetchall():
-                trigger: dict[str, Any] = {
-                    "schema": row.schema_name,
-                    "name": row.trigger_name,
-                    "full_name": f"{row.schema_name}.{row.trigger_name}",
-                    "table": f"{row.schema_name}.{row.table_name}",
-                    "type": row.trigger_type,
-                    "events": row.events if row.events else None,
-                    "is_disabled": bool(row.is_disabled),
-                }
-                triggers.append(trigger)
-
-            return triggers
-        finally:
-            conn.close()
-
-    triggers = await run_in_thread(_query)
-
-    result: dict[str, Any] = {
-        "database": MSSQL_DATABASE,
-        "server": MSSQL_SERVER,
-        "trigger_count": len(triggers),
-        "triggers": triggers[:500],
-    }
-
-    if schema_filter:
-        result["schema_filter"] = schema_filter
-
-    if len(triggers) > 500:
-        result["note"] = (
-            f"Showing first 500 of {len(triggers)} triggers. "
-            "Use schema_filter to narrow results."
-        )
-
-    logger.debug(f"Found {len(triggers)} triggers")
-    return json.dumps(result, indent=2)
-
-
-# =============================================================================
-# MCP Resources
-# =============================================================================
-
-
-@mcp.resource("mssql://tables")
-async def list_tables_resource() -> str:
-    """Resource listing all tables in the database.
-
-    Returns a newline-separated list of all table names.
-    """
-    logger.debug("Accessing tables resource")
-
-    def _query() -> list[str]:
-        """Execute query with per-request connection (thread-safe)."""
-        conn = create_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT TABLE_SCHEMA, TABLE_NAME
-                FROM INFORMATION_SCHEMA.TABLES
-                WHERE TABLE_TYPE = 'BASE TABLE'
-                ORDER BY TABLE_SCHEMA, TABLE_NAME
-            """)
-            return [f"{row.TABLE_SCHEMA}.{row.TABLE_NAME}" for row in cursor.fetchall()]
-        finally:
-            conn.close()
-
-    tables = await run_in_thread(_query)
-    return "\n".join(tables)
-
-
-@mcp.resource("mssql://views")
-async def list_views_resource() -> str:
-    """Resource listing all views in the database.
-
-    Returns a newline-separated list of all view names.
-    """
-    logger.debug("Accessing views resource")
-
-    def _query() -> list[str]:
-        """Execute query with per-request connection (thread-safe)."""
-        conn = create_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT TABLE_SCHEMA, TABLE_NAME
-                FROM INFORMATION_SCHEMA.VIEWS
-                ORDER BY TABLE_SCHEMA, TABLE_NAME
-            """)
-            return [f"{row.TABLE_SCHEMA}.{row.TABLE_NAME}" for row in cursor.fetchall()]
-        finally:
-            conn.close()
-
-    views = await run_in_thread(_query)
-    return "\n".join(views)
-
-
-@mcp.resource("mssql://schema/{schema_name}")
-async def list_schema_tables_resource(schema_name: str) -> str:
-    """Resource listing all tables in a specific schema.
-
-    Args:
-        schema_name: The schema to list tables from (e.g., 'dbo')
-
-    Returns a newline-separated list of table names in the schema.
-
-    """
-    logger.debug(f"Accessing schema resource for {schema_name}")
-
-    def _query() -> list[str]:
-        """Execute query with per-request connection (thread-safe)."""
-        conn = create_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT TABLE_NAME
-                FROM INFORMATION_SCHEMA.TABLES
-                WHERE TABLE_TYPE = 'BASE TABLE' AND TABLE_SCHEMA = ?
-                ORDER BY TABLE_NAME
-            """,
-                (schema_name,),
-            )
-            return [row.TABLE_NAME for row in cursor.fetchall()]
-        finally:
-            conn.close()
-
-    tables = await run_in_thread(_query)
-    return "\n".join(tables)
-
-
-@mcp.resource("mssql://table/{table_name}/preview")
-async def table_preview_resource(table_name: str) -> str:
-    """Resource providing a preview of table data (first 10 rows).
-
-    Args:
-        table_name: The table to preview (e.g., 'dbo.customers')
-
-    Returns JSON with column info and sample data.
-
-    """
-    logger.debug(f"Accessing table preview for {table_name}")
-
-    # Parse schema.table format
-    if "." in table_name:
-        schema, table = table_name.split(".", 1)
-    else:
-        schema = "dbo"
-        table = table_name
-
-    def _query() -> dict[str, Any]:
-        """Execute query with per-request connection (thread-safe)."""
-        conn = create_connection()
-        try:
-            cursor = conn.cursor()
-
-            # Get column info
-            cursor.execute(
-                """
-                SELECT COLUMN_NAME, DATA_TYPE
-                FROM INFORMATION_SCHEMA.COLUMNS
-                WHERE TABLE_SCHEMA = ? AND TABLE_NAME = ?
-                ORDER BY ORDINAL_POSITION
-            """,
-                (schema, table),
-            )
-            columns = [
-                {"name": row.COLUMN_NAME, "type": row.DATA_TYPE}
-                for row in cursor.fetchall()
-            ]
-
-            if not columns:
-                return {"error": f"Table '{schema}.{table}' not found"}
-
-            # Get sample data (TOP 10)
-            cursor.execute(f"SELECT TOP 10 * FROM [{schema}].[{table}]")  # noqa: S608
-            col_names = [desc[0] for desc in cursor.description]
-            rows = []
-            for row in cursor.fetchall():
-                row_dict: dict[str, str | None] = {}
-                for col, val in zip(col_names, row, strict=True):
-                    if val is None:
-                        row_dict[col] = None
-                    elif isinstance(val, bytes | bytearray):
-                        row_dict[col] = val.hex()
-                    else:
-                        row_dict[col] = str(val)
-                rows.append(row_dict)
-
-            return {
-                "table": f"{schema}.{table}",
-                "columns": columns,
-                "preview_rows": len(rows),
-                "data": rows,
-            }
-        finally:
-            conn.close()
-
-    result = await run_in_thread(_query)
-    return json.dumps(result, indent=2)
-
-
-@mcp.resource("mssql://info")
-async def database_info_resource() -> str:
-    """Resource providing database connection information.
-
-    Returns JSON with server, database, and basic statistics.
-    """
-    logger.debug("Accessing database info resource")
-
-    def _query() -> dict[str, Any]:
-        """Execute query with per-request connection (thread-safe)."""
-        conn = create_connection()
-        try:
-            cursor = conn.cursor()
-
-            # Get table count
-            cursor.execute("""
-                SELECT COUNT(*) as cnt
-                FROM INFORMATION_SCHEMA.TABLES
-                WHERE TABLE_TYPE = 'BASE TABLE'
-            """)
-            table_count = cursor.fetchone().cnt
-
-            # Get view count
-            cursor.execute("SELECT COUNT(*) as cnt FROM INFORMATION_SCHEMA.VIEWS")
-            view_count = cursor.fetchone().cnt
-
-            # Get schema list
-            cursor.execute("""
-                SELECT DISTINCT TABLE_SCHEMA
-                FROM INFORMATION_SCHEMA.TABLES
-                ORDER BY TABLE_SCHEMA
-            """)
-            schemas = [row.TABLE_SCHEMA for row in cursor.fetchall()]
-
-            return {
-                "server": MSSQL_SERVER,
-                "database": MSSQL_DATABASE,
-                "driver": ODBC_DRIVER,
-                "table_count": table_count,
-                "view_count": view_count,
-                "schemas": schemas,
-            }
-        finally:
-            conn.close()
-
-    result = await run_in_thread(_query)
-    return json.dumps(result, indent=2)
-
-
-def main() -> None:
-    """Run the MCP server with configuration and health check."""
-    # Avoid circular import by importing here
-    from mssql_mcp_server.config import load_config
-    from mssql_mcp_server.health import run_health_check
-
-    # Setup logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
-
-    # Load configuration (handles CLI args, config file, env vars)
-    config = load_config()
-
-    # Set global config for create_connection()
-    set_config(config)
-
-    # Run health check
-    logger.info("Running startup health check...")
-    if not run_health_check(config, verbose=True):
-        logger.error("Health check failed. Exiting.")
-        raise SystemExit(1)
-
-    logger.info("Starting MSSQL MCP Server...")
-    mcp.run()
-
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+"""MSSQL MCP Server - Read-Only Access to SQL Server via Windows Authentication.
+
+A Model Context Protocol (MCP) server that provides safe, read-only access to
+Microsoft SQL Server databases using Windows Authentication (Trusted Connection).
+
+Built for environments where:
+- Windows Authentication is required (no username/password)
+- Read-only access is mandated by IT policy
+- SQL Server is accessed from Windows workstations
+
+Features:
+- Windows Authentication via pyodbc Trusted_Connection
+- Read-only by design: Only SELECT queries allowed
+- Security filtering: Blocks INSERT, UPDATE, DELETE, DROP, etc.
+- Row limiting: Prevents accidental large result sets
+- Async non-blocking architecture
+- Application-level connection pooling (warm connections reused across requests)
+- MCP Resources for schema discovery
+
+Thread Safety:
+pyodbc reports threadsafety=1 (PEP 249), meaning threads may share the module
+but not connections. Each tool call borrows a connection from the pool for the
+duration of one request, so a connection is only ever used by one worker
+thread at a time.
+
+Environment Variables:
+- MSSQL_SERVER: SQL Server hostname (default: localhost)
+- MSSQL_DATABASE: Database name (default: master)
+- ODBC_DRIVER: ODBC driver name (default: ODBC Driver 17 for SQL Server)
+- MSSQL_POOL_MIN: Connections opened at startup (default: 2)
+- MSSQL_POOL_MAX: Maximum idle connections retained (default: 10)
+- MSSQL_POOL_VALIDATE_IDLE: Idle seconds before a pooled connection is
+  pinged on checkout (default: 30)
+
+Author: Jack Jones
+License: MIT
+"""
+
+import asyncio
+import functools
+import io
+import json
+import logging
+import os
+import queue
+import random
+import re
+import sys
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from datetime import date, datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Final
+
+import anyio
+import pyodbc
+from cachetools import TTLCache
+from fastmcp import FastMCP
+
+# orjson serializes several times faster than stdlib json; fall back to
+# stdlib so the server still runs if the wheel is unavailable.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+from mssql_mcp_server.errors import (
+    TRANSIENT_EXCEPTIONS,
+    SecurityError,
+    ValidationError,
+    format_error_response,
+    is_transient_error,
+)
+from mssql_mcp_server.errors import (
+    ConnectionError as MSSQLConnectionError,
+)
+
+if TYPE_CHECKING:
+    from mssql_mcp_server.config import ServerConfig
+
+# Make driver-level pooling explicit before any connection is opened: on
+# Windows the ODBC Driver Manager pools reliably, but on Linux unixODBC
+# pooling can leak handles, so disable it there and rely on the
+# application-level ConnectionPool instead.
+pyodbc.pooling = sys.platform == "win32"
+
+# Configure logging
+logger = logging.getLogger("mssql_mcp_server")
+
+# Global configuration (loaded at startup)
+# Will be initialized in main() or when imported
+_config: "ServerConfig | None" = None
+
+# Lazily built environment-variable fallback for get_config()
+_env_config: "ServerConfig | None" = None
+
+# Legacy environment variable support (will be removed in v1.0.0)
+MSSQL_SERVER: Final[str] = os.environ.get("MSSQL_SERVER", "localhost")
+MSSQL_DATABASE: Final[str] = os.environ.get("MSSQL_DATABASE", "master")
+ODBC_DRIVER: Final[str] = os.environ.get("ODBC_DRIVER", "ODBC Driver 17 for SQL Server")
+CONNECTION_TIMEOUT: Final[int] = int(os.environ.get("MSSQL_CONNECTION_TIMEOUT", "30"))
+
+# Connection pool sizing (see ConnectionPool below)
+MSSQL_POOL_MIN: Final[int] = int(os.environ.get("MSSQL_POOL_MIN", "2"))
+MSSQL_POOL_MAX: Final[int] = int(os.environ.get("MSSQL_POOL_MAX", "10"))
+
+# Pooled connections idle longer than this many seconds are pinged with
+# SELECT 1 before reuse, so a firewall- or server-side disconnect surfaces
+# as a transparent reconnect instead of a failed tool call. Recently used
+# connections skip the ping to avoid adding a round trip per request.
+_POOL_VALIDATE_IDLE: Final[float] = float(
+    os.environ.get("MSSQL_POOL_VALIDATE_IDLE", "30")
+)
+
+# Schema metadata rarely changes while the server is running, and MCP
+# clients tend to re-describe the same tables while exploring, so cache
+# fully rendered responses for a few minutes. The caches are consulted
+# only while the pool is active (i.e. inside a server lifespan), and the
+# get/set calls run on the event loop thread, so no locking is needed.
+# _describe_cache holds per-table entries keyed (kind, schema, table) and
+# is shared by DescribeTable, ListIndexes, and ListConstraints; the
+# InvalidateMetadata tool clears everything after a schema change.
+_META_CACHE_TTL: Final[int] = int(os.environ.get("MSSQL_METADATA_CACHE_TTL", "300"))
+_describe_cache: TTLCache[tuple[str, str, str], str] = TTLCache(
+    maxsize=1024, ttl=_META_CACHE_TTL
+)
+_relationships_cache: TTLCache[tuple[str, str], str] = TTLCache(
+    maxsize=1024, ttl=_META_CACHE_TTL
+)
+_catalog_cache: TTLCache[str, str] = TTLCache(maxsize=16, ttl=_META_CACHE_TTL)
+
+
+def set_config(config: "ServerConfig") -> None:
+    """Set global server configuration.
+
+    Args:
+        config: Server configuration to use
+
+    """
+    global _config
+    _config = config
+
+
+def get_config() -> "ServerConfig":
+    """Get the active server configuration.
+
+    Returns the configuration installed via :func:`set_config`, or a
+    snapshot built once from environment variables. Callers read the
+    fields they need by attribute (``cfg.max_retries``) instead of
+    unpacking a throwaway tuple on every call.
+
+    Returns:
+        Active server configuration
+
+    """
+    global _env_config
+    if _config is not None:
+        return _config
+    # Fall back to environment variables, snapshotted on first use
+    if _env_config is None:
+        from mssql_mcp_server.config import ServerConfig
+
+        _env_config = ServerConfig(
+            server=MSSQL_SERVER,
+            database=MSSQL_DATABASE,
+            driver=ODBC_DRIVER,
+            connection_timeout=CONNECTION_TIMEOUT,
+        )
+    return _env_config
+
+
+@functools.lru_cache(maxsize=4)
+def _build_conn_str(driver: str, server: str, database: str) -> str:
+    """Build an ODBC connection string, memoized on its inputs.
+
+    The connection target rarely changes at runtime, so the formatted
+    string is cached rather than rebuilt on every connection.
+
+    Args:
+        driver: ODBC driver name
+        server: SQL Server hostname
+        database: Target database name
+
+    Returns:
+        ODBC connection string using Windows Authentication
+
+    """
+    return (
+        f"DRIVER={{{driver}}};"
+        f"SERVER={server};"
+        f"DATABASE={database};"
+        f"Trusted_Connection=yes;"
+        f"TrustServerCertificate=yes;"
+    )
+
+
+def create_connection() -> pyodbc.Connection:
+    """Create a new database connection.
+
+    Creates a fresh connection using Windows Authentication.
+
+    Returns:
+        Database connection
+
+    Raises:
+        MSSQLConnectionError: If connection fails
+
+    """
+    cfg = get_config()
+    conn_str = _build_conn_str(cfg.driver, cfg.server, cfg.database)
+
+    try:
+        conn = pyodbc.connect(conn_str, timeout=cfg.connection_timeout)
+        # Set query timeout on the connection
+        conn.timeout = cfg.query_timeout
+        # Read-only session defaults, set once per connection: NOCOUNT
+        # suppresses the per-statement "N rows affected" chatter the
+        # driver would otherwise parse and discard, and LOCK_TIMEOUT
+        # keeps a blocked read from wedging a pool slot indefinitely.
+        # With pooled connections this cost is amortized across every
+        # query the connection ever serves. ANSI_WARNINGS deliberately
+        # stays ON: turning it off breaks XML data-type methods (error
+        # 1934) and disables filtered indexes and indexed views for the
+        # session's plans.
+        setup = conn.cursor()
+        setup.execute("SET NOCOUNT ON; SET ARITHABORT ON; SET LOCK_TIMEOUT 5000;")
+        setup.close()
+        return conn
+    except pyodbc.Error as e:
+        error_msg = str(e)
+        logger.error("Database connection failed: %s", error_msg)
+        raise MSSQLConnectionError(
+            message=f"Failed to connect to SQL Server: {error_msg}",
+            details={
+                "server": cfg.server,
+                "database": cfg.database,
+                "driver": cfg.driver,
+            },
+        ) from e
+
+
+class ConnectionPool:
+    """Process-wide pool of live pyodbc connections.
+
+    Opening a SQL Server connection costs a TCP + TLS handshake plus Windows
+    authentication; for short tool invocations that setup dominates latency.
+    The pool keeps warm connections in a LIFO queue (most-recently-used first,
+    so idle connections age out at the cold end) and hands them to tool calls.
+
+    The pool only becomes active once ``start()`` runs in the server lifespan.
+    Before that (e.g. in unit tests, or tools invoked outside a running
+    server), ``acquire()`` falls back to the original per-request
+    create/close behavior.
+    """
+
+    def __init__(self, min_size: int = MSSQL_POOL_MIN, max_size: int = MSSQL_POOL_MAX):
+        """Initialize the pool without opening any connections.
+
+        Args:
+            min_size: Connections opened eagerly by start()
+            max_size: Maximum idle connections retained in the pool
+
+        """
+        # Entries are (connection, idle_since) so acquire() can tell how
+        # long a connection has been sitting unused.
+        self._pool: queue.LifoQueue[tuple[pyodbc.Connection, float]] = queue.LifoQueue(
+            maxsize=max_size
+        )
+        self._min_size = min_size
+        self._started = False
+
+    @property
+    def started(self) -> bool:
+        """Whether the pool has been activated by the server lifespan."""
+        return self._started
+
+    def start(self) -> None:
+        """Seed the pool with min_size warm connections.
+
+        Connection failures during seeding are logged and ignored; the pool
+        still activates and connections are opened on demand.
+        """
+        self._started = True
+        try:
+            for _ in range(self._min_size):
+                self._pool.put_nowait((create_connection(), time.monotonic()))
+        except (MSSQLConnectionError, queue.Full) as e:
+            logger.warning("Connection pool seeding incomplete: %s", e)
+        logger.info(f"Connection pool started with {self._pool.qsize()} connection(s)")
+
+    def close(self) -> None:
+        """Drain the pool, closing every idle connection."""
+        self._started = False
+        while True:
+            try:
+                conn, _ = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                conn.close()
+            except pyodbc.Error:  # pragma: no cover - close is best-effort
+                pass
+        logger.info("Connection pool drained")
+
+    def _release(self, conn: pyodbc.Connection) -> None:
+        """Return a connection to the pool, or close it if the pool is full.
+
+        Args:
+            conn: The connection to return
+
+        """
+        try:
+            conn.rollback()  # Reset any open transaction state
+            self._pool.put_nowait((conn, time.monotonic()))
+        except (pyodbc.Error, queue.Full):
+            conn.close()
+
+    def _revalidate(self, conn: pyodbc.Connection) -> pyodbc.Connection:
+        """Ping a long-idle connection, replacing it if the ping fails.
+
+        Args:
+            conn: The idle connection to check
+
+        Returns:
+            The same connection if still alive, otherwise a fresh one
+
+        """
+        try:
+            probe = conn.cursor()
+            probe.execute("SELECT 1")
+            probe.fetchone()
+            probe.close()
+            return conn
+        except pyodbc.Error:
+            logger.info("Evicting dead pooled connection")
+            try:
+                conn.close()
+            except pyodbc.Error:  # pragma: no cover - close is best-effort
+                pass
+            return create_connection()
+
+    @contextmanager
+    def acquire(self) -> Iterator[pyodbc.Connection]:
+        """Borrow a connection for the duration of a with-block.
+
+        Yields a pooled connection when one is idle, otherwise opens a new
+        one. On clean exit the connection is rolled back and returned to the
+        pool; on pyodbc errors it is closed instead, since the connection may
+        be in an unusable state.
+
+        Yields:
+            A live database connection
+
+        """
+        if not self._started:
+            # Pool inactive: preserve per-request connection semantics
+            conn = create_connection()
+            try:
+                yield conn
+            finally:
+                conn.close()
+            return
+
+        try:
+            conn, idle_since = self._pool.get_nowait()
+        except queue.Empty:
+            conn = create_connection()
+        else:
+            if time.monotonic() - idle_since > _POOL_VALIDATE_IDLE:
+                conn = self._revalidate(conn)
+        try:
+            yield conn
+        except pyodbc.Error:
+            conn.close()
+            raise
+        except BaseException:
+            # Non-database failures (bugs in row handling, cancellation)
+            # leave the connection healthy; return it rather than leak
+            # the borrowed slot.
+            self._release(conn)
+            raise
+        else:
+            self._release(conn)
+
+
+# Shared pool instance; activated in lifespan(), dormant otherwise
+_pool = ConnectionPool()
+
+# Whether the server supports STRING_AGG (SQL Server 2017+); probed once
+# at startup. Defaults to False so the FOR XML PATH fallback is used when
+# the probe cannot run (old servers, startup failures, unit tests).
+_string_agg_supported = False
+
+
+def _detect_string_agg() -> bool:
+    """Probe the server major version for STRING_AGG support.
+
+    Returns:
+        True when ProductMajorVersion is 14 (SQL Server 2017) or newer
+
+    """
+    with _pool.acquire() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT CAST(SERVERPROPERTY('ProductMajorVersion') AS INT)")
+        row = cursor.fetchone()
+        return bool(row and row[0] and row[0] >= 14)
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[dict[str, Any]]:
+    """Lifespan context manager for server startup/shutdown.
+
+    Starts the application-level connection pool on startup and drains it
+    on shutdown.
+    """
+    cfg = get_config()
+    server_name, database = cfg.server, cfg.database
+    logger.info(f"Starting MSSQL MCP Server: server={server_name}, database={database}")
+    logger.info(
+        "Driver-level connection pooling: "
+        f"{'enabled' if pyodbc.pooling else 'disabled'}"
+    )
+    _pool.start()
+
+    global _string_agg_supported
+    try:
+        _string_agg_supported = await run_in_thread(_detect_string_agg)
+    except (MSSQLConnectionError, pyodbc.Error) as e:
+        logger.warning("Server version probe failed, using legacy SQL paths: %s", e)
+        _string_agg_supported = False
+
+    yield {"server": server_name, "database": database}
+
+    _pool.close()
+    logger.info("Shutting down MSSQL MCP Server")
+
+
+# Create FastMCP server with lifespan
+mcp: FastMCP = FastMCP("mssql-readonly", lifespan=lifespan)
+
+
+# Bound DB worker threads to the connection pool size: admitting more
+# concurrent _query calls than the pool can serve would only stack them
+# up opening surplus connections. anyio's default limiter (40 threads)
+# stays free for any non-DB blocking work.
+_db_thread_limiter = anyio.CapacityLimiter(MSSQL_POOL_MAX)
+
+# Pre-bound at import time so the per-call path skips the
+# anyio -> to_thread -> run_sync attribute chain.
+_run_sync = anyio.to_thread.run_sync
+
+
+async def run_in_thread(func: Any, *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking DB function on the bounded database thread pool."""
+    if kwargs:
+        func = functools.partial(func, **kwargs)
+    return await _run_sync(func, *args, limiter=_db_thread_limiter)
+
+
+def retry_with_backoff(func: Any, *args: Any, **kwargs: Any) -> Any:
+    """Retry a function with exponential backoff for transient errors.
+
+    Args:
+        func: The function to retry (must be a sync function)
+        *args: Positional arguments for the function
+        **kwargs: Keyword arguments for the function
+
+    Returns:
+        The function result
+
+    Raises:
+        The last exception if all retries are exhausted
+
+    """
+    cfg = get_config()
+    max_retries, retry_delay = cfg.max_retries, cfg.retry_delay
+
+    last_exception = None
+    delay = retry_delay
+    for attempt in range(max_retries + 1):
+        try:
+            return func(*args, **kwargs)
+        except TRANSIENT_EXCEPTIONS as e:
+            last_exception = e
+            if not is_transient_error(e) or attempt >= max_retries:
+                raise
+            # Truncated decorrelated backoff: draw each delay uniformly
+            # between the base and triple the previous delay, capped at
+            # max_delay. Concurrent retriers spread out instead of
+            # colliding on synchronized 2**attempt steps.
+            delay = min(cfg.max_delay, random.uniform(retry_delay, delay * 3))
+            logger.warning(
+                "Transient error on attempt %d/%d: %s. Retrying in %.1fs...",
+                attempt + 1,
+                max_retries + 1,
+                e,
+                delay,
+            )
+            time.sleep(delay)
+
+    # This should never be reached, but for type safety
+    if last_exception:
+        raise last_exception
+    raise RuntimeError("Retry loop exited unexpectedly")
+
+
+def _dump(obj: Any) -> str:
+    """Serialize a tool result to compact JSON.
+
+    Args:
+        obj: The result structure to serialize
+
+    Returns:
+        Compact JSON string
+
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+# Cell encoders for ReadData's row loop, dispatched on exact type.
+# pyodbc returns a small set of Python types; a dict lookup per cell is
+# cheaper than isinstance chains plus a generic str() round trip, and the
+# common scalar types are emitted as JSON fragments directly.
+_CELL_ENCODERS: dict[type, Any] = {
+    type(None): lambda v: "null",
+    bool: lambda v: "true" if v else "false",
+    int: str,
+    float: repr,
+    str: json.dumps,
+    bytes: lambda v: json.dumps(v.hex()),
+    bytearray: lambda v: json.dumps(v.hex()),
+    datetime: lambda v: f'"{v.isoformat()}"',
+    date: lambda v: f'"{v.isoformat()}"',
+    Decimal: lambda v: f'"{v}"',
+}
+
+
+def _encode_cell(val: Any, _get: Any = _CELL_ENCODERS.get) -> str:
+    """Encode one result cell as a JSON fragment.
+
+    Args:
+        val: The cell value from pyodbc
+        _get: Bound dispatch-table lookup (do not pass)
+
+    Returns:
+        JSON fragment for the value
+
+    """
+    encoder = _get(type(val))
+    return encoder(val) if encoder else json.dumps(str(val))
+
+
+# Matches the start of a SELECT statement (with optional DISTINCT/ALL)
+# so TOP can be inserted at the grammatically correct position.
+_SELECT_PREFIX_RE = re.compile(r"^\s*SELECT\s+(?:(?:DISTINCT|ALL)\s+)?", re.IGNORECASE)
+_TOP_RE = re.compile(r"\bTOP\b", re.IGNORECASE)
+# TOP cannot be combined with OFFSET ... FETCH (SQL Server error 10741)
+_OFFSET_RE = re.compile(r"\bOFFSET\b", re.IGNORECASE)
+
+# Read-only enforcement: queries must start with SELECT...
+_SELECT_ONLY_RE = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+
+# ...and must not contain write/DDL keywords anywhere (subqueries, CTEs,
+# statement batches). A single compiled alternation scans the query in one
+# linear pass instead of one substring search per keyword; the lookahead
+# keeps column names like updated_at from matching.
+_FORBIDDEN_RE = re.compile(
+    r"(?:^|\s)(INSERT|UPDATE|DELETE|DROP|CREATE|ALTER|EXEC|EXECUTE|TRUNCATE|"
+    r"GRANT|REVOKE|DENY|BACKUP|RESTORE|SHUTDOWN|DBCC)(?=\s|\(|$)",
+    re.IGNORECASE,
+)
+
+
+def _apply_top_clause(query: str, max_rows: int) -> tuple[str, tuple[int, ...]]:
+    """Rewrite a SELECT so SQL Server returns at most max_rows rows.
+
+    Inserts a parameterized ``TOP (?)`` after SELECT (and DISTINCT/ALL if
+    present), so the server stops producing rows at the limit instead of
+    streaming the full result set and having the client discard the tail.
+    Queries that already contain a TOP clause are left untouched, as are
+    queries using OFFSET pagination -- SQL Server rejects TOP alongside
+    OFFSET ... FETCH -- in which case the client-side fetchmany cap still
+    bounds the result.
+
+    Args:
+        query: The SELECT query to rewrite
+        max_rows: Row limit to bind to the TOP clause
+
+    Returns:
+        Tuple of (query, parameters) ready for cursor.execute
+
+    """
+    if _TOP_RE.search(query) or _OFFSET_RE.search(query):
+        return query, ()
+    m = _SELECT_PREFIX_RE.match(query)
+    if not m:
+        return query, ()
+    pos = m.end()
+    return f"{query[:pos]}TOP (?) {query[pos:]}", (max_rows,)
+
+
+def _split_qualified(name: str, default_schema: str = "dbo") -> tuple[str, str]:
+    """Split a possibly schema-qualified table name in one pass.
+
+    Args:
+        name: Table name, optionally qualified (e.g. 'sales.orders')
+        default_schema: Schema assumed when the name is unqualified
+
+    Returns:
+        Tuple of (schema, table)
+
+    """
+    schema, sep, table = name.partition(".")
+    return (schema, table) if sep else (default_schema, name)
+
+
+def handle_tool_errors(func: Any) -> Any:
+    """Handle errors in MCP tools and return consistent error responses.
+
+    Args:
+        func: The async function to wrap
+
+    Returns:
+        Wrapped function that catches errors and returns formatted JSON
+
+    Raises:
+        TypeError: If func is not an async function
+
+    """
+    # Sync tool bodies would get silently re-dispatched to a second
+    # thread pool by the framework; fail fast at decoration time instead.
+    if not asyncio.iscoroutinefunction(func):
+        raise TypeError(f"{func.__name__} must be an async function")
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> str:
+        """Wrap tool call with error handling."""
+        try:
+            result = await func(*args, **kwargs)
+            # Every tool already returns str; only coerce the oddball
+            return result if type(result) is str else str(result)
+        except Exception as e:
+            logger.error("Error in %s: %s", func.__name__, e)
+            return format_error_response(e)
+
+    return wrapper
+
+
+# =============================================================================
+# SQL statements
+# =============================================================================
+# Hoisted to module scope so the hot paths do no per-call string building
+# and SQL Server's plan cache sees identical statement text on every
+# execution.
+
+_LIST_TABLES_SQL = """
+    SELECT TOP 501 TABLE_SCHEMA, TABLE_NAME
+    FROM INFORMATION_SCHEMA.TABLES
+    WHERE TABLE_TYPE = 'BASE TABLE'
+    ORDER BY TABLE_SCHEMA, TABLE_NAME
+"""
+
+_LIST_TABLES_FILTERED_SQL = """
+    SELECT TOP 501 TABLE_SCHEMA, TABLE_NAME
+    FROM INFORMATION_SCHEMA.TABLES
+    WHERE TABLE_TYPE = 'BASE TABLE' AND TABLE_SCHEMA = ?
+"""
+
+_COUNT_TABLES_SQL = (
+    "SELECT COUNT(*) FROM INFORMATION_SCHEMA.TABLES WHERE TABLE_TYPE = 'BASE TABLE'"
+)
+
+_COUNT_TABLES_FILTERED_SQL = _COUNT_TABLES_SQL + " AND TABLE_SCHEMA = ?"
+
+_LIST_VIEWS_SQL = """
+    SELECT TOP 501 TABLE_SCHEMA, TABLE_NAME
+    FROM INFORMATION_SCHEMA.VIEWS
+    ORDER BY TABLE_SCHEMA, TABLE_NAME
+"""
+
+_LIST_VIEWS_FILTERED_SQL = """
+    SELECT TOP 501 TABLE_SCHEMA, TABLE_NAME
+    FROM INFORMATION_SCHEMA.VIEWS
+    WHERE TABLE_SCHEMA = ?
+"""
+
+_COUNT_VIEWS_SQL = "SELECT COUNT(*) FROM INFORMATION_SCHEMA.VIEWS"
+
+_COUNT_VIEWS_FILTERED_SQL = _COUNT_VIEWS_SQL + " WHERE TABLE_SCHEMA = ?"
+
+_DESCRIBE_COLUMNS_SQL = """
+    SELECT
+        COLUMN_NAME,
+        DATA_TYPE,
+        CHARACTER_MAXIMUM_LENGTH,
+        NUMERIC_PRECISION,
+        NUMERIC_SCALE,
+        IS_NULLABLE,
+        COLUMN_DEFAULT
+    FROM INFORMATION_SCHEMA.COLUMNS
+    WHERE TABLE_SCHEMA = ? AND TABLE_NAME = ?
+    ORDER BY ORDINAL_POSITION
+"""
+
+_DESCRIBE_PK_SQL = """
+    SELECT COLUMN_NAME
+    FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
+    WHERE TABLE_SCHEMA = ?
+      AND TABLE_NAME = ?
+      AND CONSTRAINT_NAME IN (
+          SELECT CONSTRAINT_NAME
+          FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS
+          WHERE TABLE_SCHEMA = ?
+            AND TABLE_NAME = ?
+            AND CONSTRAINT_TYPE = 'PRIMARY KEY'
+      )
+"""
+
+_DESCRIBE_FK_SQL = """
+    SELECT
+        COL_NAME(fkc.parent_object_id, fkc.parent_column_id) AS column_name,
+        OBJECT_SCHEMA_NAME(fkc.referenced_object_id) AS ref_schema,
+        OBJECT_NAME(fkc.referenced_object_id) AS ref_table,
+        COL_NAME(fkc.referenced_object_id, fkc.referenced_column_id) AS ref_column
+    FROM sys.foreign_key_columns fkc
+    WHERE OBJECT_SCHEMA_NAME(fkc.parent_object_id) = ?
+      AND OBJECT_NAME(fkc.parent_object_id) = ?
+"""
+
+# Single batch, three result sets, one round trip (see DescribeTable)
+_DESCRIBE_BATCH_SQL = f"{_DESCRIBE_COLUMNS_SQL};{_DESCRIBE_PK_SQL};{_DESCRIBE_FK_SQL}"
+
+_INDEXES_SQL = """
+    SELECT
+        i.name AS index_name,
+        i.type_desc AS index_type,
+        i.is_unique,
+        i.is_primary_key,
+        STRING_AGG(c.name, ', ') WITHIN GROUP (ORDER BY ic.key_ordinal) AS columns
+    FROM sys.indexes i
+    JOIN sys.index_columns ic ON i.object_id = ic.object_id AND i.index_id = ic.index_id
+    JOIN sys.columns c ON ic.object_id = c.object_id AND ic.column_id = c.column_id
+    WHERE i.object_id = OBJECT_ID(?)
+      AND i.name IS NOT NULL
+    GROUP BY i.name, i.type_desc, i.is_unique, i.is_primary_key
+    ORDER BY i.is_primary_key DESC, i.name
+"""
+
+_CONSTRAINTS_CHECK_UNIQUE_SQL = """
+    SELECT
+        tc.CONSTRAINT_NAME,
+        tc.CONSTRAINT_TYPE,
+        COALESCE(ccu.COLUMN_NAME, '') AS COLUMN_NAME,
+        COALESCE(cc.CHECK_CLAUSE, '') AS CHECK_CLAUSE
+    FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
+    LEFT JOIN INFORMATION_SCHEMA.CONSTRAINT_COLUMN_USAGE ccu
+        ON tc.CONSTRAINT_NAME = ccu.CONSTRAINT_NAME
+        AND tc.TABLE_SCHEMA = ccu.TABLE_SCHEMA
+        AND tc.TABLE_NAME = ccu.TABLE_NAME
+    LEFT JOIN INFORMATION_SCHEMA.CHECK_CONSTRAINTS cc
+        ON tc.CONSTRAINT_NAME = cc.CONSTRAINT_NAME
+    WHERE tc.TABLE_SCHEMA = ?
+      AND tc.TABLE_NAME = ?
+      AND tc.CONSTRAINT_TYPE IN ('CHECK', 'UNIQUE')
+    ORDER BY tc.CONSTRAINT_TYPE, tc.CONSTRAINT_NAME
+"""
+
+_CONSTRAINTS_DEFAULT_SQL = """
+    SELECT
+        dc.name AS constraint_name,
+        c.name AS column_name,
+        dc.definition AS default_value
+    FROM sys.default_constraints dc
+    JOIN sys.columns c ON dc.parent_object_id = c.object_id
+        AND dc.parent_column_id = c.column_id
+    WHERE OBJECT_SCHEMA_NAME(dc.parent_object_id) = ?
+      AND OBJECT_NAME(dc.parent_object_id) = ?
+    ORDER BY c.name
+"""
+
+# Single batch, two result sets, one round trip (see ListConstraints)
+_CONSTRAINTS_BATCH_SQL = f"{_CONSTRAINTS_CHECK_UNIQUE_SQL};{_CONSTRAINTS_DEFAULT_SQL}"
+
+# Outgoing FKs (the table references others)
+_FK_OUTGOING_SQL = """
+    SELECT
+        fk.name AS constraint_name,
+        OBJECT_SCHEMA_NAME(fk.referenced_object_id) AS referenced_schema,
+        OBJECT_NAME(fk.referenced_object_id) AS referenced_table,
+        COL_NAME(fkc.parent_object_id, fkc.parent_column_id) AS column_name,
+        COL_NAME(fkc.referenced_object_id, fkc.referenced_column_id) AS referenced_column,
+        fk.delete_referential_action_desc AS on_delete,
+        fk.update_referential_action_desc AS on_update,
+        fk.is_disabled,
+        fkc.constraint_column_id
+    FROM sys.foreign_keys fk
+    JOIN sys.foreign_key_columns fkc ON fk.object_id = fkc.constraint_object_id
+    WHERE OBJECT_NAME(fk.parent_object_id) = ?
+      AND OBJECT_SCHEMA_NAME(fk.parent_object_id) = ?
+    ORDER BY fk.name, fkc.constraint_column_id
+"""
+
+# Incoming FKs (other tables reference the table)
+_FK_INCOMING_SQL = """
+    SELECT
+        fk.name AS constraint_name,
+        OBJECT_SCHEMA_NAME(fk.parent_object_id) AS referencing_schema,
+        OBJECT_NAME(fk.parent_object_id) AS referencing_table,
+        COL_NAME(fkc.parent_object_id, fkc.parent_column_id) AS referencing_column,
+        COL_NAME(fkc.referenced_object_id, fkc.referenced_column_id) AS referenced_column,
+        fk.delete_referential_action_desc AS on_delete,
+        fk.update_referential_action_desc AS on_update,
+        fk.is_disabled,
+        fkc.constraint_column_id
+    FROM sys.foreign_keys fk
+    JOIN sys.foreign_key_columns fkc ON fk.object_id = fkc.constraint_object_id
+    WHERE OBJECT_NAME(fk.referenced_object_id) = ?
+      AND OBJECT_SCHEMA_NAME(fk.referenced_object_id) = ?
+    ORDER BY fk.name, fkc.constraint_column_id
+"""
+
+_LIST_PROCEDURES_SQL = """
+    SELECT TOP 501
+        SCHEMA_NAME(p.schema_id) AS schema_name,
+        p.name AS procedure_name,
+        p.create_date,
+        p.modify_date,
+        STUFF((
+            SELECT ', ' + par.name + ' ' + TYPE_NAME(par.user_type_id)
+            FROM sys.parameters par
+            WHERE par.object_id = p.object_id
+            ORDER BY par.parameter_id
+            FOR XML PATH('')
+        ), 1, 2, '') AS parameters
+    FROM sys.procedures p
+    WHERE SCHEMA_NAME(p.schema_id) = COALESCE(?, SCHEMA_NAME(p.schema_id))
+    ORDER BY schema_name, procedure_name
+"""
+
+# STRING_AGG variant for SQL Server 2017+: one grouped join instead of a
+# correlated FOR XML PATH subquery per procedure row
+_LIST_PROCEDURES_AGG_SQL = """
+    SELECT TOP 501
+        SCHEMA_NAME(p.schema_id) AS schema_name,
+        p.name AS procedure_name,
+        STRING_AGG(par.name + ' ' + TYPE_NAME(par.user_type_id), ', ')
+            WITHIN GROUP (ORDER BY par.parameter_id) AS parameters
+    FROM sys.procedures p
+    LEFT JOIN sys.parameters par ON par.object_id = p.object_id
+    WHERE SCHEMA_NAME(p.schema_id) = COALESCE(?, SCHEMA_NAME(p.schema_id))
+    GROUP BY p.schema_id, p.name
+    ORDER BY schema_name, procedure_name
+"""
+
+_COUNT_PROCEDURES_SQL = """
+    SELECT COUNT(*) FROM sys.procedures p
+    WHERE SCHEMA_NAME(p.schema_id) = COALESCE(?, SCHEMA_NAME(p.schema_id))
+"""
+
+_LIST_FUNCTIONS_SQL = """
+    SELECT TOP 501
+        SCHEMA_NAME(o.schema_id) AS schema_name,
+        o.name AS function_name,
+        o.type_desc AS function_type,
+        STUFF((
+            SELECT ', ' + par.name + ' ' + TYPE_NAME(par.user_type_id)
+            FROM sys.parameters par
+            WHERE par.object_id = o.object_id
+            ORDER BY par.parameter_id
+            FOR XML PATH('')
+        ), 1, 2, '') AS parameters
+    FROM sys.objects o
+    WHERE o.type IN ('FN', 'IF', 'TF')
+      AND SCHEMA_NAME(o.schema_id) = COALESCE(?, SCHEMA_NAME(o.schema_id))
+    ORDER BY schema_name, function_name
+"""
+
+# STRING_AGG variant for SQL Server 2017+ (see _LIST_PROCEDURES_AGG_SQL)
+_LIST_FUNCTIONS_AGG_SQL = """
+    SELECT TOP 501
+        SCHEMA_NAME(o.schema_id) AS schema_name,
+        o.name AS function_name,
+        o.type_desc AS function_type,
+        STRING_AGG(par.name + ' ' + TYPE_NAME(par.user_type_id), ', ')
+            WITHIN GROUP (ORDER BY par.parameter_id) AS parameters
+    FROM sys.objects o
+    LEFT JOIN sys.parameters par ON par.object_id = o.object_id
+    WHERE o.type IN ('FN', 'IF', 'TF')
+      AND SCHEMA_NAME(o.schema_id) = COALESCE(?, SCHEMA_NAME(o.schema_id))
+    GROUP BY o.schema_id, o.name, o.type_desc
+    ORDER BY schema_name, function_name
+"""
+
+_COUNT_FUNCTIONS_SQL = """
+    SELECT COUNT(*) FROM sys.objects o
+    WHERE o.type IN ('FN', 'IF', 'TF')
+      AND SCHEMA_NAME(o.schema_id) = COALESCE(?, SCHEMA_NAME(o.schema_id))
+"""
+
+_LIST_TRIGGERS_SQL = """
+    SELECT TOP 501
+        SCHEMA_NAME(o.schema_id) AS schema_name,
+        tr.name AS trigger_name,
+        OBJECT_NAME(tr.parent_id) AS table_name,
+        CASE tr.is_instead_of_trigger
+            WHEN 1 THEN 'INSTEAD OF'
+            ELSE 'AFTER'
+        END AS trigger_type,
+        tr.is_disabled,
+        STUFF((
+            SELECT ', ' + te.type_desc
+            FROM sys.trigger_events te
+            WHERE te.object_id = tr.object_id
+            ORDER BY te.type_desc
+            FOR XML PATH('')
+        ), 1, 2, '') AS events
+    FROM sys.triggers tr
+    INNER JOIN sys.objects o ON tr.parent_id = o.object_id
+    WHERE SCHEMA_NAME(o.schema_id) = COALESCE(?, SCHEMA_NAME(o.schema_id))
+    ORDER BY schema_name, trigger_name
+"""
+
+_COUNT_TRIGGERS_SQL = """
+    SELECT COUNT(*) FROM sys.triggers tr
+    INNER JOIN sys.objects o ON tr.parent_id = o.object_id
+    WHERE SCHEMA_NAME(o.schema_id) = COALESCE(?, SCHEMA_NAME(o.schema_id))
+"""
+
+_PREVIEW_COLUMNS_SQL = """
+    SELECT COLUMN_NAME, DATA_TYPE
+    FROM INFORMATION_SCHEMA.COLUMNS
+    WHERE TABLE_SCHEMA = ? AND TABLE_NAME = ?
+    ORDER BY ORDINAL_POSITION
+"""
+
+# Both catalog counts as one row, then the schema list as a second result
+# set: one round trip for the whole mssql://info resource
+_INFO_BATCH_SQL = """
+    SELECT
+        (SELECT COUNT(*) FROM INFORMATION_SCHEMA.TABLES
+         WHERE TABLE_TYPE = 'BASE TABLE') AS table_count,
+        (SELECT COUNT(*) FROM INFORMATION_SCHEMA.VIEWS) AS view_count;
+    SELECT DISTINCT TABLE_SCHEMA
+    FROM INFORMATION_SCHEMA.TABLES
+    ORDER BY TABLE_SCHEMA
+"""
+
+# Everything DescribeTableFull needs in one submission: eight result sets
+# (columns, PKs, column FKs, indexes, CHECK/UNIQUE constraints, DEFAULT
+# constraints, outgoing FKs, incoming FKs), one network round trip
+_DESCRIBE_FULL_BATCH_SQL = (
+    f"{_DESCRIBE_BATCH_SQL};{_INDEXES_SQL};{_CONSTRAINTS_BATCH_SQL};"
+    f"{_FK_OUTGOING_SQL};{_FK_INCOMING_SQL}"
+)
+
+
+# =============================================================================
+# MCP Tools
+# =============================================================================
+
+
+@mcp.tool()
+@handle_tool_errors
+async def ListTables(schema_filter: str | None = None) -> str:
+    """List all tables in the SQL Server database.
+
+    Args:
+        schema_filter: Optional schema name to filter tables (e.g., 'dbo')
+
+    Returns:
+        JSON string with database info and table list
+
+    """
+    logger.debug("ListTables called with schema_filter=%s", schema_filter)
+
+    if schema_filter is None and _pool.started:
+        cached = _catalog_cache.get("tables")
+        if cached is not None:
+            return cached
+
+    def _query() -> tuple[list[str], int]:
+        """Execute query with a pooled connection (thread-safe).
+
+        Fetches one row past the 500-row display cap so truncation is
+        detectable without streaming the whole catalog; the full count is
+        only computed (server-side) when the cap is actually exceeded.
+        """
+        with _pool.acquire() as conn:
+            cursor = conn.cursor()
+            if schema_filter:
+                cursor.execute(_LIST_TABLES_FILTERED_SQL, (schema_filter,))
+            else:
+                cursor.execute(_LIST_TABLES_SQL)
+
+            tables = [
+                f"{row.TABLE_SCHEMA}.{row.TABLE_NAME}" for row in cursor.fetchall()
+            ]
+
+            total = len(tables)
+            if total > 500:
+                if schema_filter:
+                    cursor.execute(_COUNT_TABLES_FILTERED_SQL, (schema_filter,))
+                else:
+                    cursor.execute(_COUNT_TABLES_SQL)
+                total = cursor.fetchone()[0]
+                del tables[500:]
+            return tables, total
+
+    # Run query with retry logic for transient errors
+    tables, total = await run_in_thread(retry_with_backoff, _query)
+
+    result: dict[str, Any] = {
+        "database": MSSQL_DATABASE,
+        "server": MSSQL_SERVER,
+        "table_count": total,
+        "tables": tables,
+    }
+
+    if total > 500:
+        result["note"] = (
+            f"Showing first 500 of {total} tables. Use schema_filter to narrow results."
+        )
+
+    logger.debug("Found %d tables", len(tables))
+    payload = _dump(result)
+    if schema_filter is None and _pool.started:
+        _catalog_cache["tables"] = payload
+    return payload
+
+
+@mcp.tool()
+@handle_tool_errors
+async def DescribeTable(table_name: str) -> str:
+    """Return the schema/structure of a specific table.
+
+    Args:
+        table_name: Name of the table (can include schema, e.g., 'dbo.oe_hdr')
+
+    Returns:
+        JSON string with column definitions
+
+    Raises:
+        ValidationError: If table_name is empty
+
+    """
+    logger.debug("DescribeTable called for %s", table_name)
+
+    schema, table = _split_qualified(table_name)
+
+    cache_key = ("columns", schema.lower(), table.lower())
+    if _pool.started:
+        cached = _describe_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    def _query() -> list[dict[str, Any]]:
+        """Execute query with per-request connection (thread-safe)."""
+        with _pool.acquire() as conn:
+            cursor = conn.cursor()
+
+            # Send all three statements as one batch: three result sets,
+            # one network round trip
+            cursor.execute(
+                _DESCRIBE_BATCH_SQL,
+                (schema, table, schema, table, schema, table, schema, table),
+            )
+
+            columns = []
+            for row in cursor.fetchall():
+                col: dict[str, Any] = {
+                    "name": row.COLUMN_NAME,
+                    "type": row.DATA_TYPE,
+                    "nullable": row.IS_NULLABLE == "YES",
+                }
+                if row.CHARACTER_MAXIMUM_LENGTH:
+                    col["max_length"] = row.CHARACTER_MAXIMUM_LENGTH
+                if row.NUMERIC_PRECISION:
+                    col["precision"] = row.NUMERIC_PRECISION
+                    col["scale"] = row.NUMERIC_SCALE
+                if row.COLUMN_DEFAULT:
+                    col["default"] = row.COLUMN_DEFAULT
+                columns.append(col)
+
+            # Advance to the primary key result set
+            cursor.nextset()
+            pk_columns = {row.COLUMN_NAME for row in cursor.fetchall()}
+
+            # Advance to the foreign key result set
+            cursor.nextset()
+            fk_map = {
+                row.column_name: {
+                    "references_table": f"{row.ref_schema}.{row.ref_table}",
+                    "references_column": row.ref_column,
+                }
+                for row in cursor.fetchall()
+            }
+
+            # Add PK and FK indicators to columns
+            for col in columns:
+                col["is_primary_key"] = col["name"] in pk_columns
+                if col["name"] in fk_map:
+                    col["foreign_key"] = fk_map[col["name"]]
+
+            return columns
+
+    columns = await run_in_thread(_query)
+
+    if not columns:
+        return _dump({"error": f"Table '{table_name}' not found or has no columns."})
+
+    result = {
+        "table": f"{schema}.{table}",
+        "column_count": len(columns),
+        "columns": columns,
+    }
+
+    logger.debug("Found %d columns for %s", len(columns), table_name)
+    payload = _dump(result)
+    if _pool.started:
+        _describe_cache[cache_key] = payload
+    return payload
+
+
+@mcp.tool()
+@handle_tool_errors
+async def ReadData(query: str, max_rows: int = 100) -> str:
+    """Execute a SELECT query and return results. Only SELECT statements allowed.
+
+    Args:
+        query: SQL SELECT query to execute
+        max_rows: Maximum rows to return (default: 100, max: 1000)
+
+    Returns:
+        JSON string with query results
+
+    Raises:
+        ValidationError: If max_rows is invalid
+        SecurityError: If query is not a SELECT or contains dangerous keywords
+
+    """
+    logger.debug("ReadData called with max_rows=%s", max_rows)
+
+    # Validate max_rows parameter
+    if max_rows <= 0:
+        raise ValidationError(
+            message="max_rows must be positive",
+            parameter="max_rows",
+            value=str(max_rows),
+        )
+
+    # Cheap guards run before any connection is acquired, so invalid
+    # queries are rejected without paying for a pool checkout
+    if len(query) > 10_000:
+        raise ValidationError(
+            message="Query too long (max 10000 characters)",
+            parameter="query",
+            value=f"{len(query)} characters",
+        )
+
+    depth = 0
+    for ch in query:
+        if ch == "(":
+            depth += 1
+            if depth > 32:
+                raise ValidationError(
+                    message="Query nesting too deep (max 32 levels)",
+                    parameter="query",
+                )
+        elif ch == ")":
+            depth -= 1
+
+    # Security: Only allow SELECT statements
+    if not _SELECT_ONLY_RE.match(query):
+        logger.warning("Blocked non-SELECT query attempt")
+        raise SecurityError(
+            message="Only SELECT queries are allowed. This server is read-only.",
+            query=query,
+            blocked_keyword="non-SELECT statement",
+        )
+
+    # Block dangerous keywords that could appear in subqueries or CTEs
+    forbidden = _FORBIDDEN_RE.search(query)
+    if forbidden:
+        keyword = forbidden.group(1).upper()
+        logger.warning("Blocked query with forbidden keyword: %s", keyword)
+        raise SecurityError(
+            message=f"Query contains forbidden keyword '{keyword}'. This server is read-only.",
+            query=query,
+            blocked_keyword=keyword,
+        )
+
+    # Limit rows
+    max_rows = min(max_rows, 1000)
+
+    # Push the row limit into the query so SQL Server stops at max_rows
+    exec_query, exec_params = _apply_top_clause(query, max_rows)
+
+    def _execute() -> tuple[str, int]:
+        """Execute query and stream results straight into compact JSON.
+
+        Value conversion and JSON serialization happen in one pass as rows
+        come off the cursor, so no intermediate list-of-dicts is built and
+        the result structure is never re-walked by json.dumps.
+        """
+        with _pool.acquire() as conn:
+            cursor = conn.cursor()
+            # Fetch the bounded result in one block instead of a
+            # per-row SQLFetch round trip
+            cursor.arraysize = max_rows
+            if exec_params:
+                cursor.execute(exec_query, exec_params)
+            else:
+                cursor.execute(exec_query)
+
+            # Get column names; encode each once for reuse as JSON keys
+            columns = [desc[0] for desc in cursor.description]
+            encoded_cols = [json.dumps(col) for col in columns]
+
+            buf = io.StringIO()
+            write = buf.write
+            write('{"columns":')
+            write(json.dumps(columns, separators=(",", ":")))
+            write(f',"max_rows":{max_rows},"data":[')
+            row_count = 0
+            for row in cursor.fetchmany(max_rows):
+                if row_count:
+                    write(",")
+                row_count += 1
+                write("{")
+                for i, (col, val) in enumerate(zip(encoded_cols, row, strict=True)):
+                    if i:
+                        write(",")
+                    write(col)
+                    write(":")
+                    write(_encode_cell(val))
+                write("}")
+            write(f'],"row_count":{row_count}')
+            if row_count == max_rows:
+                note = (
+                    f"Results limited to {max_rows} rows. "
+                    "Increase max_rows or add WHERE clause."
+                )
+                write(f',"note":{json.dumps(note)}')
+            write("}")
+            return buf.getvalue(), row_count
+
+    payload: str
+    try:
+        payload, row_count = await run_in_thread(_execute)
+    except pyodbc.Error as e:
+        logger.error("Database error: %s", e)
+        return _dump({"error": f"Database Error: {e!s}"})
+
+    logger.debug("Query returned %d rows", row_count)
+    return payload
+
+
+@mcp.tool()
+@handle_tool_errors
+async def ListViews(schema_filter: str | None = None) -> str:
+    """List all views in the SQL Server database.
+
+    Args:
+        schema_filter: Optional schema name to filter views (e.g., 'dbo')
+
+    Returns:
+        JSON string with database info and view list
+
+    """
+    logger.debug("ListViews called with schema_filter=%s", schema_filter)
+
+    if schema_filter is None and _pool.started:
+        cached = _catalog_cache.get("views")
+        if cached is not None:
+            return cached
+
+    def _query() -> tuple[list[str], int]:
+        """Execute query with a pooled connection (thread-safe).
+
+        Fetches one row past the 500-row display cap so truncation is
+        detectable without streaming the whole catalog; the full count is
+        only computed (server-side) when the cap is actually exceeded.
+        """
+        with _pool.acquire() as conn:
+            cursor = conn.cursor()
+            if schema_filter:
+                cursor.execute(_LIST_VIEWS_FILTERED_SQL, (schema_filter,))
+            else:
+                cursor.execute(_LIST_VIEWS_SQL)
+
+            views = [
+                f"{row.TABLE_SCHEMA}.{row.TABLE_NAME}" for row in cursor.fetchall()
+            ]
+
+            total = len(views)
+            if total > 500:
+                if schema_filter:
+                    cursor.execute(_COUNT_VIEWS_FILTERED_SQL, (schema_filter,))
+                else:
+                    cursor.execute(_COUNT_VIEWS_SQL)
+                total = cursor.fetchone()[0]
+                del views[500:]
+            return views, total
+
+    views, total = await run_in_thread(_query)
+
+    result: dict[str, Any] = {
+        "database": MSSQL_DATABASE,
+        "server": MSSQL_SERVER,
+        "view_count": total,
+        "views": views,
+    }
+
+    if total > 500:
+        result["note"] = (
+            f"Showing first 500 of {total} views. Use schema_filter to narrow results."
+        )
+
+    logger.debug("Found %d views", len(views))
+    payload = _dump(result)
+    if schema_filter is None and _pool.started:
+        _catalog_cache["views"] = payload
+    return payload
+
+
+@mcp.tool()
+@handle_tool_errors
+async def GetTableRelationships(table_name: str) -> str:
+    """Return foreign key relationships for a specific table.
+
+    Args:
+        table_name: Name of the table (can include schema, e.g., 'dbo.oe_hdr')
+
+    Returns:
+        JSON string with incoming and outgoing foreign key relationships including:
+        - Constraint names
+        - Column mappings (supports composite foreign keys)
+        - Referential actions (ON DELETE, ON UPDATE)
+        - Enabled/disabled status
+        - Full schema-qualified table names
+
+    """
+    logger.debug("GetTableRelationships called for %s", table_name)
+
+    schema, table = _split_qualified(table_name)
+
+    cache_key = (schema.lower(), table.lower())
+    if _pool.started:
+        cached = _relationships_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    def _fetch_outgoing() -> list[dict[str, Any]]:
+        """Fetch and group outgoing FKs on one pooled connection.
+
+        Iterates the cursor directly (block-fetched via arraysize) and
+        groups composite FKs by constraint, so the intermediate Row list
+        a fetchall() would build is never materialized.
+        """
+        with _pool.acquire() as conn:
+            cursor = conn.cursor()
+            cursor.arraysize = 128
+            cursor.execute(_FK_OUTGOING_SQL, (table, schema))
+            outgoing_map: dict[str, dict[str, Any]] = {}
+            for row in cursor:
+                if row.constraint_name not in outgoing_map:
+                    outgoing_map[row.constraint_name] = {
+                        "constraint": row.constraint_name,
+                        "columns": [],
+                        "references_table": (
+                            f"{row.referenced_schema}.{row.referenced_table}"
+                        ),
+                        "references_columns": [],
+                        "on_delete": row.on_delete,
+                        "on_update": row.on_update,
+                        "is_disabled": bool(row.is_disabled),
+                    }
+                outgoing_map[row.constraint_name]["columns"].append(row.column_name)
+                outgoing_map[row.constraint_name]["references_columns"].append(
+                    row.referenced_column
+                )
+            return list(outgoing_map.values())
+
+    def _fetch_incoming() -> list[dict[str, Any]]:
+        """Fetch and group incoming FKs on one pooled connection."""
+        with _pool.acquire() as conn:
+            cursor = conn.cursor()
+            cursor.arraysize = 128
+            cursor.execute(_FK_INCOMING_SQL, (table, schema))
+            incoming_map: dict[str, dict[str, Any]] = {}
+            for row in cursor:
+                if row.constraint_name not in incoming_map:
+                    incoming_map[row.constraint_name] = {
+                        "constraint": row.constraint_name,
+                        "from_table": (
+                            f"{row.referencing_schema}.{row.referencing_table}"
+                        ),
+                        "from_columns": [],
+                        "to_columns": [],
+                        "on_delete": row.on_delete,
+                        "on_update": row.on_update,
+                        "is_disabled": bool(row.is_disabled),
+                    }
+                incoming_map[row.constraint_name]["from_columns"].append(
+                    row.referencing_column
+                )
+                incoming_map[row.constraint_name]["to_columns"].append(
+                    row.referenced_column
+                )
+            return list(incoming_map.values())
+
+    # The two queries are independent, so run them concurrently on two
+    # pooled connections and let the round trips overlap
+    outgoing, incoming = await asyncio.gather(
+        run_in_thread(_fetch_outgoing),
+        run_in_thread(_fetch_incoming),
+    )
+
+    result = {
+        "table": f"{schema}.{table}",
+        "outgoing_relationships": outgoing,
+        "incoming_relationships": incoming,
+        "outgoing_count": len(outgoing),
+        "incoming_count": len(incoming),
+    }
+
+    logger.debug(
+        f"Found {len(outgoing)} outgoing, {len(incoming)} incoming relationships"
+    )
+    payload = _dump(result)
+    if _pool.started:
+        _relationships_cache[cache_key] = payload
+    return payload
+
+
+@mcp.tool()
+@handle_tool_errors
+async def ListIndexes(table_name: str) -> str:
+    """List indexes defined on a table with columns and types.
+
+    Args:
+        table_name: Table name (can include schema, e.g., 'dbo.customers')
+
+    Returns:
+        JSON string with index definitions including columns and types
+
+    """
+    logger.debug("ListIndexes called for %s", table_name)
+
+    schema, table = _split_qualified(table_name)
+
+    cache_key = ("indexes", schema.lower(), table.lower())
+    if _pool.started:
+        cached = _describe_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    def _query() -> list[dict[str, Any]]:
+        """Execute query with per-request connection (thread-safe)."""
+        with _pool.acquire() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_INDEXES_SQL, (f"{schema}.{table}",))
+
+            return [
+                {
+                    "name": row.index_name,
+                    "type": row.index_type,
+                    "is_unique": bool(row.is_unique),
+                    "is_primary_key": bool(row.is_primary_key),
+                    "columns": row.columns,
+                }
+                for row in cursor.fetchall()
+            ]
+
+    indexes = await run_in_thread(_query)
+
+    result = {
+        "table": f"{schema}.{table}",
+        "index_count": len(indexes),
+        "indexes": indexes,
+    }
+
+    logger.debug("Found %d indexes for %s", len(indexes), table_name)
+    payload = _dump(result)
+    if _pool.started:
+        _describe_cache[cache_key] = payload
+    return payload
+
+
+@mcp.tool()
+@handle_tool_errors
+async def ListConstraints(table_name: str) -> str:
+    """List constraints defined on a table (CHECK, UNIQUE, DEFAULT).
+
+    Args:
+        table_name: Table name (can include schema, e.g., 'dbo.orders')
+
+    Returns:
+        JSON string with constraint definitions
+
+    """
+    logger.debug("ListConstraints called for %s", table_name)
+
+    schema, table = _split_qualified(table_name)
+
+    cache_key = ("constraints", schema.lower(), table.lower())
+    if _pool.started:
+        cached = _describe_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    def _query() -> list[dict[str, Any]]:
+        """Execute query with per-request connection (thread-safe)."""
+        with _pool.acquire() as conn:
+            cursor = conn.cursor()
+
+            # Send both statements as one batch: two result sets
+            # (CHECK/UNIQUE then DEFAULT), one network round trip
+            cursor.execute(_CONSTRAINTS_BATCH_SQL, (schema, table, schema, table))
+
+            constraints = []
+            for row in cursor.fetchall():
+                constraint: dict[str, Any] = {
+                    "name": row.CONSTRAINT_NAME,
+                    "type": row.CONSTRAINT_TYPE,
+                }
+                if row.COLUMN_NAME:
+                    constraint["column"] = row.COLUMN_NAME
+                if row.CHECK_CLAUSE:
+                    constraint["definition"] = row.CHECK_CLAUSE
+
+                constraints.append(constraint)
+
+            # Advance to the DEFAULT constraint result set
+            cursor.nextset()
+            for row in cursor.fetchall():
+                constraints.append(
+                    {
+                        "name": row.constraint_name,
+                        "type": "DEFAULT",
+                        "column": row.column_name,
+                        "definition": row.default_value,
+                    }
+                )
+
+            return constraints
+
+    constraints = await run_in_thread(_query)
+
+    result = {
+        "table": f"{schema}.{table}",
+        "constraint_count": len(constraints),
+        "constraints": constraints,
+    }
+
+    logger.debug("Found %d constraints for %s", len(constraints), table_name)
+    payload = _dump(result)
+    if _pool.started:
+        _describe_cache[cache_key] = payload
+    return payload
+
+
+@mcp.tool()
+@handle_tool_errors
+async def DescribeTableFull(table_name: str) -> str:
+    """Return columns, indexes, constraints, and relationships in one call.
+
+    Combines DescribeTable, ListIndexes, ListConstraints, and
+    GetTableRelationships for the common "inspect this table" workflow:
+    all underlying queries go to the server as a single batch, so one
+    round trip replaces the four separate tool calls.
+
+    Args:
+        table_name: Table name (can include schema, e.g., 'dbo.orders')
+
+    Returns:
+        JSON string with columns, indexes, constraints, and FK relationships
+
+    """
+    logger.debug("DescribeTableFull called for %s", table_name)
+
+    schema, table = _split_qualified(table_name)
+
+    cache_key = ("full", schema.lower(), table.lower())
+    if _pool.started:
+        cached = _describe_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    def _query() -> dict[str, Any]:
+        """Execute the combined batch with a pooled connection (thread-safe)."""
+        with _pool.acquire() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                _DESCRIBE_FULL_BATCH_SQL,
+                (
+                    # columns + PK + column-level FK lookups
+                    *(schema, table) * 4,
+                    # indexes
+                    f"{schema}.{table}",
+                    # CHECK/UNIQUE + DEFAULT constraints
+                    *(schema, table) * 2,
+                    # outgoing + incoming foreign keys
+                    table,
+                    schema,
+                    table,
+                    schema,
+                ),
+            )
+
+            # Result set 1: column definitions
+            columns = []
+            for row in cursor.fetchall():
+                col: dict[str, Any] = {
+                    "name": row.COLUMN_NAME,
+                    "type": row.DATA_TYPE,
+                    "nullable": row.IS_NULLABLE == "YES",
+                }
+                if row.CHARACTER_MAXIMUM_LENGTH:
+                    col["max_length"] = row.CHARACTER_MAXIMUM_LENGTH
+                if row.NUMERIC_PRECISION:
+                    col["precision"] = row.NUMERIC_PRECISION
+                    col["scale"] = row.NUMERIC_SCALE
+                if row.COLUMN_DEFAULT:
+                    col["default"] = row.COLUMN_DEFAULT
+                columns.append(col)
+
+            # Result set 2: primary key columns
+            cursor.nextset()
+            pk_columns = {row.COLUMN_NAME for row in cursor.fetchall()}
+
+            # Result set 3: column-level foreign keys
+            cursor.nextset()
+            fk_map = {
+                row.column_name: {
+                    "references_table": f"{row.ref_schema}.{row.ref_table}",
+                    "references_column": row.ref_column,
+                }
+                for row in cursor.fetchall()
+            }
+
+            for col in columns:
+                col["is_primary_key"] = col["name"] in pk_columns
+                if col["name"] in fk_map:
+                    col["foreign_key"] = fk_map[col["name"]]
+
+            # Result set 4: indexes
+            cursor.nextset()
+            indexes = [
+                {
+                    "name": row.index_name,
+                    "type": row.index_type,
+                    "is_unique": bool(row.is_unique),
+                    "is_primary_key": bool(row.is_primary_key),
+                    "columns": row.columns,
+                }
+                for row in cursor.fetchall()
+            ]
+
+            # Result set 5: CHECK and UNIQUE constraints
+            cursor.nextset()
+            constraints = []
+            for row in cursor.fetchall():
+                constraint: dict[str, Any] = {
+                    "name": row.CONSTRAINT_NAME,
+                    "type": row.CONSTRAINT_TYPE,
+                }
+                if row.COLUMN_NAME:
+                    constraint["column"] = row.COLUMN_NAME
+                if row.CHECK_CLAUSE:
+                    constraint["definition"] = row.CHECK_CLAUSE
+                constraints.append(constraint)
+
+            # Result set 6: DEFAULT constraints
+            cursor.nextset()
+            for row in cursor.fetchall():
+                constraints.append(
+                    {
+                        "name": row.constraint_name,
+                        "type": "DEFAULT",
+                        "column": row.column_name,
+                        "definition": row.default_value,
+                    }
+                )
+
+            # Result set 7: outgoing FKs, grouped by constraint
+            cursor.nextset()
+            outgoing_map: dict[str, dict[str, Any]] = {}
+            for row in cursor.fetchall():
+                if row.constraint_name not in outgoing_map:
+                    outgoing_map[row.constraint_name] = {
+                        "constraint": row.constraint_name,
+                        "columns": [],
+                        "references_table": (
+                            f"{row.referenced_schema}.{row.referenced_table}"
+                        ),
+                        "references_columns": [],
+                        "on_delete": row.on_delete,
+                        "on_update": row.on_update,
+                        "is_disabled": bool(row.is_disabled),
+                    }
+                outgoing_map[row.constraint_name]["columns"].append(row.column_name)
+                outgoing_map[row.constraint_name]["references_columns"].append(
+                    row.referenced_column
+                )
+
+            # Result set 8: incoming FKs, grouped by constraint
+            cursor.nextset()
+            incoming_map: dict[str, dict[str, Any]] = {}
+            for row in cursor.fetchall():
+                if row.constraint_name not in incoming_map:
+                    incoming_map[row.constraint_name] = {
+                        "constraint": row.constraint_name,
+                        "from_table": (
+                            f"{row.referencing_schema}.{row.referencing_table}"
+                        ),
+                        "from_columns": [],
+                        "to_columns": [],
+                        "on_delete": row.on_delete,
+                        "on_update": row.on_update,
+                        "is_disabled": bool(row.is_disabled),
+                    }
+                incoming_map[row.constraint_name]["from_columns"].append(
+                    row.referencing_column
+                )
+                incoming_map[row.constraint_name]["to_columns"].append(
+                    row.referenced_column
+                )
+
+            return {
+                "columns": columns,
+                "indexes": indexes,
+                "constraints": constraints,
+                "outgoing_relationships": list(outgoing_map.values()),
+                "incoming_relationships": list(incoming_map.values()),
+            }
+
+    details = await run_in_thread(_query)
+
+    if not details["columns"]:
+        return _dump({"error": f"Table '{table_name}' not found or has no columns."})
+
+    result = {
+        "table": f"{schema}.{table}",
+        "column_count": len(details["columns"]),
+        "index_count": len(details["indexes"]),
+        "constraint_count": len(details["constraints"]),
+        "outgoing_count": len(details["outgoing_relationships"]),
+        "incoming_count": len(details["incoming_relationships"]),
+        **details,
+    }
+
+    logger.debug("Collected full description for %s", table_name)
+    payload = _dump(result)
+    if _pool.started:
+        _describe_cache[cache_key] = payload
+    return payload
+
+
+@mcp.tool()
+@handle_tool_errors
+async def ListStoredProcedures(schema_filter: str | None = None) -> str:
+    """List stored procedures in the database with parameter information.
+
+    Args:
+        schema_filter: Optional schema to filter (e.g., 'dbo')
+
+    Returns:
+        JSON string with stored procedure names and parameter info
+
+    """
+    logger.debug("ListStoredProcedures called with schema_filter=%s", schema_filter)
+
+    if schema_filter is None and _pool.started:
+        cached = _catalog_cache.get("procedures")
+        if cached is not None:
+            return cached
+
+    def _query() -> tuple[list[dict[str, Any]], int]:
+        """Execute query with a pooled connection (thread-safe).
+
+        Fetches one row past the 500-row display cap so truncation is
+        detectable without streaming the whole catalog; the full count is
+        only computed (server-side) when the cap is actually exceeded.
+        """
+        with _pool.acquire() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                (
+                    _LIST_PROCEDURES_AGG_SQL
+                    if _string_agg_supported
+                    else _LIST_PROCEDURES_SQL
+                ),
+                (schema_filter,),
+            )
+
+            procedures = [
+                {
+                    "schema": row.schema_name,
+                    "name": row.procedure_name,
+                    "full_name": f"{row.schema_name}.{row.procedure_name}",
+                    "parameters": row.parameters if row.parameters else None,
+                }
+                for row in cursor.fetchall()
+            ]
+
+            total = len(procedures)
+            if total > 500:
+                cursor.execute(_COUNT_PROCEDURES_SQL, (schema_filter,))
+                total = cursor.fetchone()[0]
+                del procedures[500:]
+            return procedures, total
+
+    procedures, total = await run_in_thread(_query)
+
+    result: dict[str, Any] = {
+        "database": MSSQL_DATABASE,
+        "server": MSSQL_SERVER,
+        "procedure_count": total,
+        "procedures": procedures,
+    }
+
+    if schema_filter:
+        result["schema_filter"] = schema_filter
+
+    if total > 500:
+        result["note"] = (
+            f"Showing first 500 of {total} procedures. "
+            "Use schema_filter to narrow results."
+        )
+
+    logger.debug("Found %d stored procedures", len(procedures))
+    payload = _dump(result)
+    if schema_filter is None and _pool.started:
+        _catalog_cache["procedures"] = payload
+    return payload
+
+
+@mcp.tool()
+@handle_tool_errors
+async def ListFunctions(schema_filter: str | None = None) -> str:
+    """List user-defined functions in the database with parameter information.
+
+    Args:
+        schema_filter: Optional schema to filter (e.g., 'dbo')
+
+    Returns:
+        JSON string with function names, types, and parameter info
+
+    """
+    logger.debug("ListFunctions called with schema_filter=%s", schema_filter)
+
+    if schema_filter is None and _pool.started:
+        cached = _catalog_cache.get("functions")
+        if cached is not None:
+            return cached
+
+    def _query() -> tuple[list[dict[str, Any]], int]:
+        """Execute query with a pooled connection (thread-safe).
+
+        Fetches one row past the 500-row display cap so truncation is
+        detectable without streaming the whole catalog; the full count is
+        only computed (server-side) when the cap is actually exceeded.
+        """
+        with _pool.acquire() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                (
+                    _LIST_FUNCTIONS_AGG_SQL
+                    if _string_agg_supported
+                    else _LIST_FUNCTIONS_SQL
+                ),
+                (schema_filter,),
+            )
+
+            functions = [
+                {
+                    "schema": row.schema_name,
+                    "name": row.function_name,
+                    "full_name": f"{row.schema_name}.{row.function_name}",
+                    "type": row.function_type,
+                    "parameters": row.parameters if row.parameters else None,
+                }
+                for row in cursor.fetchall()
+            ]
+
+            total = len(functions)
+            if total > 500:
+                cursor.execute(_COUNT_FUNCTIONS_SQL, (schema_filter,))
+                total = cursor.fetchone()[0]
+                del functions[500:]
+            return functions, total
+
+    functions, total = await run_in_thread(_query)
+
+    result: dict[str, Any] = {
+        "database": MSSQL_DATABASE,
+        "server": MSSQL_SERVER,
+        "function_count": total,
+        "functions": functions,
+    }
+
+    if schema_filter:
+        result["schema_filter"] = schema_filter
+
+    if total > 500:
+        result["note"] = (
+            f"Showing first 500 of {total} functions. "
+            "Use schema_filter to narrow results."
+        )
+
+    logger.debug("Found %d user-defined functions", len(functions))
+    payload = _dump(result)
+    if schema_filter is None and _pool.started:
+        _catalog_cache["functions"] = payload
+    return payload
+
+
+@mcp.tool()
+@handle_tool_errors
+async def ListTriggers(schema_filter: str | None = None) -> str:
+    """List triggers in the database with event and type information.
+
+    Args:
+        schema_filter: Optional schema name to filter triggers (e.g., 'dbo').
+
+    Returns:
+        JSON string containing trigger metadata including name, schema, table,
+        type (AFTER/INSTEAD OF), events (INSERT, UPDATE, DELETE), and enabled status.
+
+    """
+    logger.debug("ListTriggers called with schema_filter=%s", schema_filter)
+
+    if schema_filter is None and _pool.started:
+        cached = _catalog_cache.get("triggers")
+        if cached is not None:
+            return cached
+
+    def _query() -> tuple[list[dict[str, Any]], int]:
+        """Execute query with a pooled connection (thread-safe).
+
+        Fetches one row past the 500-row display cap so truncation is
+        detectable without streaming the whole catalog; the full count is
+        only computed (server-side) when the cap is actually exceeded.
+        """
+        with _pool.acquire() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_LIST_TRIGGERS_SQL, (schema_filter,))
+
+            triggers = [
+                {
+                    "schema": row.schema_name,
+                    "name": row.trigger_name,
+                    "full_name": f"{row.schema_name}.{row.trigger_name}",
+                    "table": f"{row.schema_name}.{row.table_name}",
+                    "type": row.trigger_type,
+                    "events": row.events if row.events else None,
+                    "is_disabled": bool(row.is_disabled),
+                }
+                for row in cursor.fetchall()
+            ]
+
+            total = len(triggers)
+            if total > 500:
+                cursor.execute(_COUNT_TRIGGERS_SQL, (schema_filter,))
+                total = cursor.fetchone()[0]
+                del triggers[500:]
+            return triggers, total
+
+    triggers, total = await run_in_thread(_query)
+
+    result: dict[str, Any] = {
+        "database": MSSQL_DATABASE,
+        "server": MSSQL_SERVER,
+        "trigger_count": total,
+        "triggers": triggers,
+    }
+
+    if schema_filter:
+        result["schema_filter"] = schema_filter
+
+    if total > 500:
+        result["note"] = (
+            f"Showing first 500 of {total} triggers. "
+            "Use schema_filter to narrow results."
+        )
+
+    logger.debug("Found %d triggers", len(triggers))
+    payload = _dump(result)
+    if schema_filter is None and _pool.started:
+        _catalog_cache["triggers"] = payload
+    return payload
+
+
+@mcp.tool()
+@handle_tool_errors
+async def InvalidateMetadata() -> str:
+    """Clear cached schema metadata so subsequent calls re-query the database.
+
+    Metadata tools cache their responses for a few minutes. Call this after
+    a schema change (new table, altered column, etc.) to see it immediately
+    instead of waiting for the cache TTL to expire.
+
+    Returns:
+        JSON string with the number of cache entries cleared
+
+    """
+    cleared = len(_describe_cache) + len(_relationships_cache) + len(_catalog_cache)
+    _describe_cache.clear()
+    _relationships_cache.clear()
+    _catalog_cache.clear()
+
+    logger.debug("Metadata cache invalidated (%d entries)", cleared)
+    return _dump({"status": "ok", "entries_cleared": cleared})
+
+
+# =============================================================================
+# MCP Resources
+# =============================================================================
+
+
+@mcp.resource("mssql://tables")
+async def list_tables_resource() -> str:
+    """Resource listing all tables in the database.
+
+    Returns a newline-separated list of all table names.
+    """
+    logger.debug("Accessing tables resource")
+
+    if _pool.started:
+        cached = _catalog_cache.get("res:tables")
+        if cached is not None:
+            return cached
+
+    def _query() -> list[str]:
+        """Execute query with per-request connection (thread-safe)."""
+        with _pool.acquire() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT TABLE_SCHEMA, TABLE_NAME
+                FROM INFORMATION_SCHEMA.TABLES
+                WHERE TABLE_TYPE = 'BASE TABLE'
+                ORDER BY TABLE_SCHEMA, TABLE_NAME
+            """)
+            return [f"{row.TABLE_SCHEMA}.{row.TABLE_NAME}" for row in cursor.fetchall()]
+
+    tables = await run_in_thread(_query)
+    rendered = "\n".join(tables)
+    if _pool.started:
+        _catalog_cache["res:tables"] = rendered
+    return rendered
+
+
+@mcp.resource("mssql://views")
+async def list_views_resource() -> str:
+    """Resource listing all views in the database.
+
+    Returns a newline-separated list of all view names.
+    """
+    logger.debug("Accessing views resource")
+
+    if _pool.started:
+        cached = _catalog_cache.get("res:views")
+        if cached is not None:
+            return cached
+
+    def _query() -> list[str]:
+        """Execute query with per-request connection (thread-safe)."""
+        with _pool.acquire() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT TABLE_SCHEMA, TABLE_NAME
+                FROM INFORMATION_SCHEMA.VIEWS
+                ORDER BY TABLE_SCHEMA, TABLE_NAME
+            """)
+            return [f"{row.TABLE_SCHEMA}.{row.TABLE_NAME}" for row in cursor.fetchall()]
+
+    views = await run_in_thread(_query)
+    rendered = "\n".join(views)
+    if _pool.started:
+        _catalog_cache["res:views"] = rendered
+    return rendered
+
+
+@mcp.resource("mssql://schema/{schema_name}")
+async def list_schema_tables_resource(schema_name: str) -> str:
+    """Resource listing all tables in a specific schema.
+
+    Args:
+        schema_name: The schema to list tables from (e.g., 'dbo')
+
+    Returns a newline-separated list of table names in the schema.
+
+    """
+    logger.debug("Accessing schema resource for %s", schema_name)
+
+    def _query() -> list[str]:
+        """Execute query with per-request connection (thread-safe)."""
+        with _pool.acquire() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT TABLE_NAME
+                FROM INFORMATION_SCHEMA.TABLES
+                WHERE TABLE_TYPE = 'BASE TABLE' AND TABLE_SCHEMA = ?
+                ORDER BY TABLE_NAME
+            """,
+                (schema_name,),
+            )
+            return [row.TABLE_NAME for row in cursor.fetchall()]
+
+    tables = await run_in_thread(_query)
+    return "\n".join(tables)
+
+
+@mcp.resource("mssql://table/{table_name}/preview")
+async def table_preview_resource(table_name: str) -> str:
+    """Resource providing a preview of table data (first 10 rows).
+
+    Args:
+        table_name: The table to preview (e.g., 'dbo.customers')
+
+    Returns JSON with column info and sample data.
+
+    """
+    logger.debug("Accessing table preview for %s", table_name)
+
+    schema, table = _split_qualified(table_name)
+
+    def _query() -> dict[str, Any]:
+        """Execute query with per-request connection (thread-safe).
+
+        Sends the column metadata query and the TOP 10 sample as one
+        batch, so a preview costs a single network round trip. The table
+        identifier cannot be bound as a parameter, so it keeps the
+        existing bracket quoting.
+        """
+        batch = (
+            f"{_PREVIEW_COLUMNS_SQL};"
+            f"SELECT TOP 10 * FROM [{schema}].[{table}]"  # noqa: S608
+        )
+        with _pool.acquire() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(batch, (schema, table))
+                columns = [
+                    {"name": row.COLUMN_NAME, "type": row.DATA_TYPE}
+                    for row in cursor.fetchall()
+                ]
+                if not columns:
+                    return {"error": f"Table '{schema}.{table}' not found"}
+
+                # Advance to the sample-data result set
+                cursor.nextset()
+                col_names = [desc[0] for desc in cursor.description]
+                rows = []
+                for row in cursor.fetchall():
+                    row_dict: dict[str, str | None] = {}
+                    for col, val in zip(col_names, row, strict=True):
+                        if val is None:
+                            row_dict[col] = None
+                        elif isinstance(val, bytes | bytearray):
+                            row_dict[col] = val.hex()
+                        else:
+                            row_dict[col] = str(val)
+                    rows.append(row_dict)
+            except pyodbc.Error:
+                # A missing table fails the whole batch; re-check the
+                # metadata half alone so it is reported cleanly instead
+                # of surfacing as a driver error.
+                probe = conn.cursor()
+                probe.execute(_PREVIEW_COLUMNS_SQL, (schema, table))
+                if not probe.fetchall():
+                    return {"error": f"Table '{schema}.{table}' not found"}
+                raise
+
+            return {
+                "table": f"{schema}.{table}",
+                "columns": columns,
+                "preview_rows": len(rows),
+                "data": rows,
+            }
+
+    result = await run_in_thread(_query)
+    return _dump(result)
+
+
+@mcp.resource("mssql://info")
+async def database_info_resource() -> str:
+    """Resource providing database connection information.
+
+    Returns JSON with server, database, and basic statistics.
+    """
+    logger.debug("Accessing database info resource")
+
+    if _pool.started:
+        cached = _catalog_cache.get("res:info")
+        if cached is not None:
+            return cached
+
+    def _query() -> dict[str, Any]:
+        """Execute query with per-request connection (thread-safe)."""
+        with _pool.acquire() as conn:
+            cursor = conn.cursor()
+
+            # Both counts and the schema list in one batch: two result
+            # sets, one network round trip
+            cursor.execute(_INFO_BATCH_SQL)
+            counts = cursor.fetchone()
+
+            cursor.nextset()
+            schemas = [row.TABLE_SCHEMA for row in cursor.fetchall()]
+
+            return {
+                "server": MSSQL_SERVER,
+                "database": MSSQL_DATABASE,
+                "driver": ODBC_DRIVER,
+                "table_count": counts.table_count,
+                "view_count": counts.view_count,
+                "schemas": schemas,
+            }
+
+    result = await run_in_thread(_query)
+    payload = _dump(result)
+    if _pool.started:
+        _catalog_cache["res:info"] = payload
+    return payload
+
+
+def main() -> None:
+    """Run the MCP server with configuration and health check."""
+    # Avoid circular import by importing here
+    from mssql_mcp_server.config import load_config
+    from mssql_mcp_server.health import run_health_check
+
+    # Setup logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    # Load configuration (handles CLI args, config file, env vars)
+    config = load_config()
+
+    # Set global config for create_connection()
+    set_config(config)
+
+    # Run health check
+    logger.info("Running startup health check...")
+    if not run_health_check(config, verbose=True):
+        logger.error("Health check failed. Exiting.")
+        raise SystemExit(1)
+
+    logger.info("Starting MSSQL MCP Server...")
+    mcp.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 """Pytest configuration and shared fixtures for MSSQL MCP Server tests."""
 
+from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -15,6 +16,17 @@ class MockRow:
             setattr(self, key, value)
 
 
+@pytest.fixture(autouse=True)
+def isolate_config_cache(tmp_path, monkeypatch):
+    """Redirect the config pickle cache away from the real user cache dir.
+
+    The cache path is derived from ``Path.home()``, so pointing home at
+    tmp_path keeps the cache code paths exercised without leaking pickle
+    entries into the developer's real ``~/.cache`` directory.
+    """
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+
 @pytest.fixture
 def mock_cursor():
     """Create a mock database cursor."""
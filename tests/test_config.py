@@ -1,12 +1,18 @@
 """Tests for configuration module."""
 
+import os
+import pickle
 import tempfile
 from pathlib import Path
 
 import pytest
 
 from mssql_mcp_server.config import (
+    _CACHE_MAX_ENTRIES,
     ServerConfig,
+    _config_cache_path,
+    _prune_cache_dir,
+    _read_toml_fields,
     load_config,
     load_from_env,
     load_from_toml,
@@ -41,11 +47,11 @@ class TestServerConfig:
         assert config.connection_timeout == 60
 
     def test_validate_success(self):
-        """Validate should return empty list for valid config."""
+        """Validate should return empty result for valid config."""
         config = ServerConfig()
         errors = config.validate()
 
-        assert errors == []
+        assert errors == ()
 
     def test_validate_empty_server(self):
         """Validate should fail for empty server."""
@@ -218,6 +224,117 @@ server = "partial-server"
             config_path.unlink()
 
 
+class TestConfigCache:
+    """Tests for the TOML config pickle cache.
+
+    The autouse ``isolate_config_cache`` fixture points ``Path.home()``
+    at tmp_path, so the cache directory used here is
+    ``tmp_path/.cache/mssql-mcp-server``.
+    """
+
+    CACHE_SUBDIR = Path(".cache") / "mssql-mcp-server"
+
+    def _write_toml(self, tmp_path, server="cached-server"):
+        """Write a minimal TOML config file and return its path."""
+        config_path = tmp_path / "config.toml"
+        config_path.write_text(f'[mssql]\nserver = "{server}"\n')
+        return config_path
+
+    def test_cold_read_writes_cache_entry(self, tmp_path):
+        """A first read should parse the TOML and write one cache entry."""
+        config_path = self._write_toml(tmp_path)
+
+        fields = _read_toml_fields(config_path)
+
+        assert fields == {"server": "cached-server"}
+        cache_dir = tmp_path / self.CACHE_SUBDIR
+        assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+    def test_warm_read_hits_cache(self, tmp_path):
+        """A second read of an unchanged file should come from the cache."""
+        config_path = self._write_toml(tmp_path)
+        _read_toml_fields(config_path)
+
+        # Plant a sentinel in the cache entry; a warm read must return it
+        # verbatim, proving the TOML file was not re-parsed
+        cache_path = _config_cache_path(config_path, config_path.stat())
+        cache_path.write_bytes(pickle.dumps({"server": "from-cache"}))
+
+        assert _read_toml_fields(config_path) == {"server": "from-cache"}
+
+    def test_file_change_invalidates_cache(self, tmp_path):
+        """Editing the config file should key a fresh cache entry."""
+        config_path = self._write_toml(tmp_path)
+        _read_toml_fields(config_path)
+
+        # Sentinel for the old (path, mtime, size) key; the edit below
+        # changes the size, so the sentinel must never be consulted
+        cache_path = _config_cache_path(config_path, config_path.stat())
+        cache_path.write_bytes(pickle.dumps({"server": "stale-entry"}))
+        self._write_toml(tmp_path, server="edited-server-name")
+
+        assert _read_toml_fields(config_path) == {"server": "edited-server-name"}
+
+    def test_corrupt_cache_entry_falls_back_to_parsing(self, tmp_path):
+        """A truncated or garbage cache entry should be ignored."""
+        config_path = self._write_toml(tmp_path)
+        cache_path = _config_cache_path(config_path, config_path.stat())
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(b"not a pickle")
+
+        assert _read_toml_fields(config_path) == {"server": "cached-server"}
+
+    def test_non_dict_cache_entry_falls_back_to_parsing(self, tmp_path):
+        """A cache entry that unpickles to a non-dict should be ignored."""
+        config_path = self._write_toml(tmp_path)
+        cache_path = _config_cache_path(config_path, config_path.stat())
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(pickle.dumps(["wrong", "shape"]))
+
+        assert _read_toml_fields(config_path) == {"server": "cached-server"}
+
+    def test_nocache_env_var_bypasses_cache(self, tmp_path, monkeypatch):
+        """MSSQL_CONFIG_NOCACHE=1 should skip both cache read and write."""
+        monkeypatch.setenv("MSSQL_CONFIG_NOCACHE", "1")
+        config_path = self._write_toml(tmp_path)
+
+        fields = _read_toml_fields(config_path)
+
+        assert fields == {"server": "cached-server"}
+        assert not (tmp_path / self.CACHE_SUBDIR).exists()
+
+    def test_prune_keeps_newest_entries(self, tmp_path):
+        """Pruning should drop the oldest entries past the cap."""
+        cache_dir = tmp_path / self.CACHE_SUBDIR
+        cache_dir.mkdir(parents=True)
+        for i in range(_CACHE_MAX_ENTRIES + 8):
+            entry = cache_dir / f"entry-{i:03d}.pkl"
+            entry.write_bytes(pickle.dumps({}))
+            # Stagger mtimes so "oldest" is well-defined on coarse clocks
+            os.utime(entry, (i, i))
+
+        _prune_cache_dir(cache_dir)
+
+        remaining = sorted(p.name for p in cache_dir.glob("*.pkl"))
+        assert len(remaining) == _CACHE_MAX_ENTRIES
+        assert remaining[0] == "entry-008.pkl"
+
+    def test_write_prunes_cache_dir(self, tmp_path):
+        """Writing a new entry should prune the directory past the cap."""
+        cache_dir = tmp_path / self.CACHE_SUBDIR
+        cache_dir.mkdir(parents=True)
+        for i in range(_CACHE_MAX_ENTRIES):
+            entry = cache_dir / f"old-{i:03d}.pkl"
+            entry.write_bytes(pickle.dumps({}))
+            os.utime(entry, (i, i))
+
+        config_path = self._write_toml(tmp_path)
+        _read_toml_fields(config_path)
+
+        assert len(list(cache_dir.glob("*.pkl"))) == _CACHE_MAX_ENTRIES
+        assert not (cache_dir / "old-000.pkl").exists()
+
+
 class TestParseCliArgs:
     """Tests for parse_cli_args function."""
 
@@ -7,6 +7,7 @@ import pyodbc
 import pytest
 
 from mssql_mcp_server import errors, server
+from mssql_mcp_server.config import ServerConfig
 
 
 class TestErrorClasses:
@@ -149,6 +150,56 @@ class TestReadDataSecurityErrors:
         assert "max_rows must be positive" in data["message"]
 
 
+class TestReadDataInputLimits:
+    """Test the pre-connection query length and nesting guards."""
+
+    @pytest.mark.asyncio
+    async def test_query_over_length_cap_rejected(self):
+        """Queries longer than 10,000 characters should be rejected."""
+        query = "SELECT * FROM users".ljust(10_001)
+        result = await server.ReadData.fn(query)
+        data = json.loads(result)
+        assert data["error"] == "VALIDATION_ERROR"
+        assert "Query too long" in data["message"]
+
+    @pytest.mark.asyncio
+    async def test_query_at_length_cap_accepted(self):
+        """A query of exactly 10,000 characters should pass the guard.
+
+        The query carries a forbidden keyword, so reaching the keyword
+        check (SECURITY_ERROR, not VALIDATION_ERROR) proves the length
+        guard let it through.
+        """
+        query = "SELECT * FROM users; DROP TABLE users".ljust(10_000)
+        assert len(query) == 10_000
+        result = await server.ReadData.fn(query)
+        data = json.loads(result)
+        assert data["error"] == "SECURITY_ERROR"
+        assert "forbidden keyword" in data["message"]
+
+    @pytest.mark.asyncio
+    async def test_query_over_nesting_cap_rejected(self):
+        """33 levels of parenthesis nesting should be rejected."""
+        query = f"SELECT {'(' * 33}1{')' * 33}"
+        result = await server.ReadData.fn(query)
+        data = json.loads(result)
+        assert data["error"] == "VALIDATION_ERROR"
+        assert "nesting too deep" in data["message"]
+
+    @pytest.mark.asyncio
+    async def test_query_at_nesting_cap_accepted(self):
+        """Exactly 32 levels of nesting should pass the guard.
+
+        As above, the trailing forbidden keyword shows the query reached
+        the security check rather than tripping the nesting guard.
+        """
+        query = f"SELECT {'(' * 32}1{')' * 32}; DROP TABLE users"
+        result = await server.ReadData.fn(query)
+        data = json.loads(result)
+        assert data["error"] == "SECURITY_ERROR"
+        assert "forbidden keyword" in data["message"]
+
+
 class TestRetryLogic:
     """Test retry logic with exponential backoff."""
 
@@ -166,7 +217,7 @@ class TestRetryLogic:
             return "success"
 
         with patch("mssql_mcp_server.server.get_config") as mock_config:
-            mock_config.return_value = ("localhost", "master", "driver", 30, 30, 3, 0.1)
+            mock_config.return_value = ServerConfig(driver="driver", retry_delay=0.1)
             result = server.retry_with_backoff(failing_func)
             assert result == "success"
             assert attempt_count == 2  # First fail, second success
@@ -182,7 +233,7 @@ class TestRetryLogic:
             raise pyodbc.Error("42000", "Syntax error")
 
         with patch("mssql_mcp_server.server.get_config") as mock_config:
-            mock_config.return_value = ("localhost", "master", "driver", 30, 30, 3, 0.1)
+            mock_config.return_value = ServerConfig(driver="driver", retry_delay=0.1)
             with pytest.raises(pyodbc.Error):
                 server.retry_with_backoff(failing_func)
             assert attempt_count == 1  # No retries
@@ -198,15 +249,9 @@ class TestRetryLogic:
             raise pyodbc.Error("08S01", "Communication link failure")
 
         with patch("mssql_mcp_server.server.get_config") as mock_config:
-            mock_config.return_value = (
-                "localhost",
-                "master",
-                "driver",
-                30,
-                30,
-                2,
-                0.01,
-            )  # max_retries=2
+            mock_config.return_value = ServerConfig(
+                driver="driver", max_retries=2, retry_delay=0.01
+            )
             with pytest.raises(pyodbc.Error):
                 server.retry_with_backoff(failing_func)
             assert attempt_count == 3  # Initial + 2 retries
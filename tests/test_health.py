@@ -55,12 +55,12 @@ class TestCheckDatabaseConnection:
 
     def test_successful_connection(self, mock_config, mock_connection, mock_cursor):
         """Successful connection should return database info."""
-        # Mock database responses
-        mock_cursor.fetchone.side_effect = [
-            MockRow(version="Microsoft SQL Server 2019 (RTM) - 15.0.2000.5"),
-            MockRow(database_name="test-db"),
-            MockRow(server_name="TEST-SERVER"),
-        ]
+        # Mock database response (single combined metadata query)
+        mock_cursor.fetchone.return_value = MockRow(
+            version="Microsoft SQL Server 2019 (RTM) - 15.0.2000.5",
+            database_name="test-db",
+            server_name="TEST-SERVER",
+        )
 
         with patch(
             "mssql_mcp_server.health.pyodbc.connect", return_value=mock_connection
@@ -140,11 +140,11 @@ class TestCheckDatabaseConnection:
             "Enterprise Edition (64-bit) on Windows Server 2019 Standard 10.0 <X64> (Build 17763: ) (Hypervisor)\n"
         )
 
-        mock_cursor.fetchone.side_effect = [
-            MockRow(version=long_version),
-            MockRow(database_name="test-db"),
-            MockRow(server_name="TEST-SERVER"),
-        ]
+        mock_cursor.fetchone.return_value = MockRow(
+            version=long_version,
+            database_name="test-db",
+            server_name="TEST-SERVER",
+        )
 
         with patch(
             "mssql_mcp_server.health.pyodbc.connect", return_value=mock_connection
@@ -164,11 +164,11 @@ class TestRunHealthCheck:
         self, mock_config, mock_connection, mock_cursor
     ):
         """Successful health check with verbose=True should log results."""
-        mock_cursor.fetchone.side_effect = [
-            MockRow(version="Microsoft SQL Server 2019"),
-            MockRow(database_name="test-db"),
-            MockRow(server_name="TEST-SERVER"),
-        ]
+        mock_cursor.fetchone.return_value = MockRow(
+            version="Microsoft SQL Server 2019",
+            database_name="test-db",
+            server_name="TEST-SERVER",
+        )
 
         with patch(
             "mssql_mcp_server.health.pyodbc.connect", return_value=mock_connection
@@ -184,11 +184,11 @@ class TestRunHealthCheck:
         self, mock_config, mock_connection, mock_cursor
     ):
         """Successful health check with verbose=False should not log details."""
-        mock_cursor.fetchone.side_effect = [
-            MockRow(version="Microsoft SQL Server 2019"),
-            MockRow(database_name="test-db"),
-            MockRow(server_name="TEST-SERVER"),
-        ]
+        mock_cursor.fetchone.return_value = MockRow(
+            version="Microsoft SQL Server 2019",
+            database_name="test-db",
+            server_name="TEST-SERVER",
+        )
 
         with patch(
             "mssql_mcp_server.health.pyodbc.connect", return_value=mock_connection
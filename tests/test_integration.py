@@ -149,18 +149,47 @@ class TestDescribeTableIntegration:
 class TestGetTableRelationshipsIntegration:
     """Integration tests for GetTableRelationships tool."""
 
+    @staticmethod
+    def _fk_connection_factory(outgoing_rows, incoming_rows):
+        """Build a create_connection replacement for the concurrent FK queries.
+
+        The outgoing and incoming queries run in parallel on separate
+        connections, so each mock connection routes fetchall results by the
+        SQL it executed rather than by call order.
+        """
+        from unittest.mock import MagicMock
+
+        def make_connection():
+            """Create a mock connection whose cursor routes by query text."""
+            conn = MagicMock()
+            cursor = MagicMock()
+            conn.cursor.return_value = cursor
+            selected = {"rows": []}
+
+            def _execute(query, params=None):
+                if "OBJECT_NAME(fk.parent_object_id) = ?" in query:
+                    selected["rows"] = outgoing_rows
+                else:
+                    selected["rows"] = incoming_rows
+                cursor.fetchall.return_value = selected["rows"]
+                return cursor
+
+            cursor.execute.side_effect = _execute
+            cursor.__iter__.side_effect = lambda: iter(selected["rows"])
+            return conn
+
+        return make_connection
+
     @pytest.mark.asyncio
     async def test_get_relationships_returns_outgoing_and_incoming(
-        self, mock_connection, mock_cursor, sample_outgoing_fks, sample_incoming_fks
+        self, sample_outgoing_fks, sample_incoming_fks
     ):
         """GetTableRelationships should return both outgoing and incoming FKs."""
-        mock_cursor.fetchall.side_effect = [
-            sample_outgoing_fks,  # Outgoing FKs
-            sample_incoming_fks,  # Incoming FKs
-        ]
-
         with patch(
-            "mssql_mcp_server.server.create_connection", return_value=mock_connection
+            "mssql_mcp_server.server.create_connection",
+            side_effect=self._fk_connection_factory(
+                sample_outgoing_fks, sample_incoming_fks
+            ),
         ):
             result = await server.GetTableRelationships.fn("dbo.orders")
             data = json.loads(result)
@@ -187,17 +216,11 @@ class TestGetTableRelationshipsIntegration:
             assert incoming["to_columns"] == ["id"]
 
     @pytest.mark.asyncio
-    async def test_get_relationships_composite_foreign_key(
-        self, mock_connection, mock_cursor, sample_composite_fk
-    ):
+    async def test_get_relationships_composite_foreign_key(self, sample_composite_fk):
         """GetTableRelationships should group composite FKs by constraint."""
-        mock_cursor.fetchall.side_effect = [
-            sample_composite_fk,  # Composite FK (2 columns)
-            [],  # No incoming FKs
-        ]
-
         with patch(
-            "mssql_mcp_server.server.create_connection", return_value=mock_connection
+            "mssql_mcp_server.server.create_connection",
+            side_effect=self._fk_connection_factory(sample_composite_fk, []),
         ):
             result = await server.GetTableRelationships.fn("dbo.order_items")
             data = json.loads(result)
@@ -386,3 +409,269 @@ class TestListTriggersIntegration:
             )
             assert instead_trigger["type"] == "INSTEAD OF"
             assert instead_trigger["is_disabled"] is True
+
+
+class TestInvalidateMetadataIntegration:
+    """Integration tests for InvalidateMetadata tool."""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_clears_all_metadata_caches(self):
+        """InvalidateMetadata should empty every metadata cache."""
+        server._describe_cache[("columns", "dbo", "users")] = "{}"
+        server._relationships_cache[("dbo", "orders")] = "{}"
+        server._catalog_cache["tables"] = "{}"
+
+        result = await server.InvalidateMetadata.fn()
+        data = json.loads(result)
+
+        assert data["status"] == "ok"
+        assert data["entries_cleared"] == 3
+        assert len(server._describe_cache) == 0
+        assert len(server._relationships_cache) == 0
+        assert len(server._catalog_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_invalidate_with_empty_caches(self):
+        """InvalidateMetadata on empty caches should report zero entries."""
+        server._describe_cache.clear()
+        server._relationships_cache.clear()
+        server._catalog_cache.clear()
+
+        result = await server.InvalidateMetadata.fn()
+        data = json.loads(result)
+
+        assert data["status"] == "ok"
+        assert data["entries_cleared"] == 0
+
+
+class TestDescribeTableFullIntegration:
+    """Integration tests for DescribeTableFull tool."""
+
+    @pytest.mark.asyncio
+    async def test_combined_result_covers_all_sections(
+        self,
+        mock_connection,
+        mock_cursor,
+        sample_columns,
+        sample_primary_keys,
+        sample_foreign_keys,
+        sample_indexes,
+        sample_outgoing_fks,
+        sample_incoming_fks,
+    ):
+        """DescribeTableFull should return every section from one batch."""
+        check_unique = [
+            MockRow(
+                CONSTRAINT_NAME="CK_users_age",
+                CONSTRAINT_TYPE="CHECK",
+                COLUMN_NAME="age",
+                CHECK_CLAUSE="([age]>=(18))",
+            )
+        ]
+        defaults = [
+            MockRow(
+                constraint_name="DF_users_created_at",
+                column_name="created_at",
+                default_value="(getdate())",
+            )
+        ]
+        # One fetchall per result set, in batch order
+        mock_cursor.fetchall.side_effect = [
+            sample_columns,
+            sample_primary_keys,
+            sample_foreign_keys,
+            sample_indexes,
+            check_unique,
+            defaults,
+            sample_outgoing_fks,
+            sample_incoming_fks,
+        ]
+
+        with patch(
+            "mssql_mcp_server.server.create_connection", return_value=mock_connection
+        ):
+            result = await server.DescribeTableFull.fn("dbo.users")
+            data = json.loads(result)
+
+            assert data["table"] == "dbo.users"
+            assert data["column_count"] == 3
+            assert data["index_count"] == 2
+            assert data["constraint_count"] == 2
+            assert data["outgoing_count"] == 1
+            assert data["incoming_count"] == 1
+
+            # Columns carry PK/FK annotations as in DescribeTable
+            id_col = next(c for c in data["columns"] if c["name"] == "id")
+            assert id_col["is_primary_key"] is True
+
+            # Both constraint kinds are merged into one list
+            types = {c["type"] for c in data["constraints"]}
+            assert types == {"CHECK", "DEFAULT"}
+
+            # Relationships are grouped by constraint
+            assert data["outgoing_relationships"][0]["columns"] == ["customer_id"]
+            assert data["incoming_relationships"][0]["from_table"] == "dbo.order_items"
+
+            # The whole description used a single execute (one round trip)
+            assert mock_cursor.execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_table_returns_error(self, mock_connection, mock_cursor):
+        """DescribeTableFull should report missing tables like DescribeTable."""
+        mock_cursor.fetchall.return_value = []
+
+        with patch(
+            "mssql_mcp_server.server.create_connection", return_value=mock_connection
+        ):
+            result = await server.DescribeTableFull.fn("dbo.nonexistent")
+            data = json.loads(result)
+
+            assert "error" in data
+            assert "not found" in data["error"]
+
+
+class TestReadDataIntegration:
+    """Integration tests for the ReadData execution pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_read_data_pushes_top_into_query(self, mock_connection, mock_cursor):
+        """ReadData should execute with a parameterized TOP clause."""
+        mock_cursor.description = [("id", int, None, None, None, None, None)]
+        mock_cursor.fetchmany.return_value = [(1,), (2,)]
+
+        with patch(
+            "mssql_mcp_server.server.create_connection", return_value=mock_connection
+        ):
+            result = await server.ReadData.fn("SELECT id FROM users", max_rows=50)
+            data = json.loads(result)
+
+            mock_cursor.execute.assert_called_once_with(
+                "SELECT TOP (?) id FROM users", (50,)
+            )
+            mock_cursor.fetchmany.assert_called_once_with(50)
+            assert data["columns"] == ["id"]
+            assert data["row_count"] == 2
+            assert data["data"] == [{"id": 1}, {"id": 2}]
+            assert "note" not in data
+
+    @pytest.mark.asyncio
+    async def test_read_data_keeps_existing_top(self, mock_connection, mock_cursor):
+        """Queries that already carry TOP should run unchanged."""
+        mock_cursor.description = [("id", int, None, None, None, None, None)]
+        mock_cursor.fetchmany.return_value = [(1,)]
+
+        with patch(
+            "mssql_mcp_server.server.create_connection", return_value=mock_connection
+        ):
+            await server.ReadData.fn("SELECT TOP 5 id FROM users")
+
+            mock_cursor.execute.assert_called_once_with("SELECT TOP 5 id FROM users")
+
+    @pytest.mark.asyncio
+    async def test_read_data_keeps_offset_pagination(
+        self, mock_connection, mock_cursor
+    ):
+        """OFFSET ... FETCH queries must not gain a TOP clause."""
+        query = (
+            "SELECT id FROM users ORDER BY id OFFSET 10 ROWS FETCH NEXT 20 ROWS ONLY"
+        )
+        mock_cursor.description = [("id", int, None, None, None, None, None)]
+        mock_cursor.fetchmany.return_value = [(11,)]
+
+        with patch(
+            "mssql_mcp_server.server.create_connection", return_value=mock_connection
+        ):
+            result = await server.ReadData.fn(query)
+            data = json.loads(result)
+
+            mock_cursor.execute.assert_called_once_with(query)
+            assert data["data"] == [{"id": 11}]
+
+    @pytest.mark.asyncio
+    async def test_read_data_encodes_cell_types(self, mock_connection, mock_cursor):
+        """Dates, decimals, bytes, bools, and NULLs should encode cleanly."""
+        from datetime import datetime
+        from decimal import Decimal
+
+        mock_cursor.description = [
+            ("created_at", None, None, None, None, None, None),
+            ("price", None, None, None, None, None, None),
+            ("blob", None, None, None, None, None, None),
+            ("active", None, None, None, None, None, None),
+            ("notes", None, None, None, None, None, None),
+        ]
+        mock_cursor.fetchmany.return_value = [
+            (
+                datetime(2024, 1, 15, 10, 30, 0),
+                Decimal("19.99"),
+                b"\xde\xad",
+                True,
+                None,
+            ),
+        ]
+
+        with patch(
+            "mssql_mcp_server.server.create_connection", return_value=mock_connection
+        ):
+            result = await server.ReadData.fn("SELECT * FROM orders")
+            data = json.loads(result)
+
+            row = data["data"][0]
+            assert row["created_at"] == "2024-01-15T10:30:00"
+            assert row["price"] == "19.99"
+            assert row["blob"] == "dead"
+            assert row["active"] is True
+            assert row["notes"] is None
+
+    @pytest.mark.asyncio
+    async def test_read_data_truncation_note(self, mock_connection, mock_cursor):
+        """Hitting the row cap should add the truncation note."""
+        mock_cursor.description = [("id", int, None, None, None, None, None)]
+        mock_cursor.fetchmany.return_value = [(1,), (2,)]
+
+        with patch(
+            "mssql_mcp_server.server.create_connection", return_value=mock_connection
+        ):
+            result = await server.ReadData.fn("SELECT id FROM users", max_rows=2)
+            data = json.loads(result)
+
+            assert data["row_count"] == 2
+            assert data["max_rows"] == 2
+            assert "note" in data
+            assert "limited to 2 rows" in data["note"]
+
+    @pytest.mark.asyncio
+    async def test_read_data_empty_result(self, mock_connection, mock_cursor):
+        """An empty result should produce an empty data array."""
+        mock_cursor.description = [("id", int, None, None, None, None, None)]
+        mock_cursor.fetchmany.return_value = []
+
+        with patch(
+            "mssql_mcp_server.server.create_connection", return_value=mock_connection
+        ):
+            result = await server.ReadData.fn("SELECT id FROM users WHERE 1 = 0")
+            data = json.loads(result)
+
+            assert data["row_count"] == 0
+            assert data["data"] == []
+            assert "note" not in data
+
+    @pytest.mark.asyncio
+    async def test_read_data_database_error_returns_json_error(
+        self, mock_connection, mock_cursor
+    ):
+        """Database errors should surface as a JSON error payload."""
+        import pyodbc
+
+        mock_cursor.execute.side_effect = pyodbc.Error(
+            "42S02", "Invalid object name 'missing'"
+        )
+
+        with patch(
+            "mssql_mcp_server.server.create_connection", return_value=mock_connection
+        ):
+            result = await server.ReadData.fn("SELECT id FROM missing")
+            data = json.loads(result)
+
+            assert "error" in data
+            assert "Database Error" in data["error"]
@@ -0,0 +1,226 @@
+"""Connection pool tests for MSSQL MCP Server."""
+
+import queue
+import time
+from unittest.mock import MagicMock, patch
+
+import pyodbc
+import pytest
+
+import mssql_mcp_server.server as server
+from mssql_mcp_server.server import ConnectionPool
+
+
+@pytest.fixture
+def make_conn():
+    """Return a factory producing distinct mock connections."""
+
+    def _make():
+        conn = MagicMock()
+        conn.cursor.return_value = MagicMock()
+        return conn
+
+    return _make
+
+
+class TestPoolLifecycle:
+    """Tests for pool start/close behavior."""
+
+    def test_start_seeds_min_size_connections(self, make_conn):
+        """start() should open min_size connections eagerly."""
+        pool = ConnectionPool(min_size=2, max_size=4)
+
+        with patch(
+            "mssql_mcp_server.server.create_connection", side_effect=make_conn
+        ) as mock_create:
+            pool.start()
+
+        assert pool.started
+        assert mock_create.call_count == 2
+        assert pool._pool.qsize() == 2
+
+    def test_start_survives_seeding_failure(self):
+        """Seeding failures should not prevent pool activation."""
+        pool = ConnectionPool(min_size=2, max_size=4)
+        error = server.MSSQLConnectionError("Failed to connect")
+
+        with patch("mssql_mcp_server.server.create_connection", side_effect=error):
+            pool.start()
+
+        assert pool.started
+        assert pool._pool.qsize() == 0
+
+    def test_close_drains_and_deactivates(self, make_conn):
+        """close() should close every idle connection and deactivate."""
+        pool = ConnectionPool(min_size=2, max_size=4)
+        conns = [make_conn(), make_conn()]
+
+        with patch("mssql_mcp_server.server.create_connection", side_effect=conns):
+            pool.start()
+        pool.close()
+
+        assert not pool.started
+        assert pool._pool.qsize() == 0
+        for conn in conns:
+            conn.close.assert_called_once()
+
+
+class TestPoolAcquire:
+    """Tests for acquire/release semantics."""
+
+    def test_not_started_falls_back_to_per_request(self, make_conn):
+        """An inactive pool should create and close per request."""
+        pool = ConnectionPool(min_size=2, max_size=4)
+        conn = make_conn()
+
+        with patch("mssql_mcp_server.server.create_connection", return_value=conn):
+            with pool.acquire() as borrowed:
+                assert borrowed is conn
+
+        conn.close.assert_called_once()
+        assert pool._pool.qsize() == 0
+
+    def test_acquire_reuses_pooled_connection(self, make_conn):
+        """A pooled connection should be borrowed and returned."""
+        pool = ConnectionPool(min_size=1, max_size=4)
+        conn = make_conn()
+
+        with patch("mssql_mcp_server.server.create_connection", return_value=conn):
+            pool.start()
+
+        with pool.acquire() as borrowed:
+            assert borrowed is conn
+            assert pool._pool.qsize() == 0
+
+        conn.close.assert_not_called()
+        assert pool._pool.qsize() == 1
+
+    def test_acquire_opens_new_connection_when_empty(self, make_conn):
+        """An empty started pool should open a connection on demand."""
+        pool = ConnectionPool(min_size=0, max_size=4)
+        pool.start()
+        conn = make_conn()
+
+        with patch("mssql_mcp_server.server.create_connection", return_value=conn):
+            with pool.acquire() as borrowed:
+                assert borrowed is conn
+
+        # Returned to the pool, not closed
+        conn.close.assert_not_called()
+        assert pool._pool.qsize() == 1
+
+    def test_pyodbc_error_closes_connection(self, make_conn):
+        """Database errors should evict the borrowed connection."""
+        pool = ConnectionPool(min_size=1, max_size=4)
+        conn = make_conn()
+
+        with patch("mssql_mcp_server.server.create_connection", return_value=conn):
+            pool.start()
+
+        with pytest.raises(pyodbc.Error):
+            with pool.acquire():
+                raise pyodbc.Error("08S01", "Communication link failure")
+
+        conn.close.assert_called_once()
+        assert pool._pool.qsize() == 0
+
+    def test_generic_error_returns_connection(self, make_conn):
+        """Non-database errors must not leak the borrowed connection."""
+        pool = ConnectionPool(min_size=1, max_size=4)
+        conn = make_conn()
+
+        with patch("mssql_mcp_server.server.create_connection", return_value=conn):
+            pool.start()
+
+        with pytest.raises(KeyError):
+            with pool.acquire():
+                raise KeyError("bug in row handling")
+
+        conn.close.assert_not_called()
+        assert pool._pool.qsize() == 1
+
+    def test_release_closes_when_pool_full(self, make_conn):
+        """A connection returned to a full pool should be closed."""
+        pool = ConnectionPool(min_size=1, max_size=1)
+        pooled, extra = make_conn(), make_conn()
+
+        with patch("mssql_mcp_server.server.create_connection", return_value=pooled):
+            pool.start()
+
+        pool._release(extra)
+
+        extra.close.assert_called_once()
+        assert pool._pool.qsize() == 1
+
+
+class TestPoolRevalidation:
+    """Tests for idle-connection revalidation."""
+
+    def test_fresh_connection_skips_revalidation(self, make_conn):
+        """Recently used connections should not be pinged."""
+        pool = ConnectionPool(min_size=1, max_size=4)
+        conn = make_conn()
+
+        with patch("mssql_mcp_server.server.create_connection", return_value=conn):
+            pool.start()
+
+        with pool.acquire():
+            pass
+
+        conn.cursor.return_value.execute.assert_not_called()
+
+    def test_long_idle_connection_is_pinged(self, make_conn):
+        """Connections idle past the threshold should be pinged."""
+        pool = ConnectionPool(min_size=0, max_size=4)
+        pool.start()
+        conn = make_conn()
+        stale = time.monotonic() - (server._POOL_VALIDATE_IDLE + 1)
+        pool._pool.put_nowait((conn, stale))
+
+        with pool.acquire() as borrowed:
+            assert borrowed is conn
+
+        conn.cursor.return_value.execute.assert_called_once_with("SELECT 1")
+
+    def test_dead_idle_connection_is_replaced(self, make_conn):
+        """A failed ping should evict the connection and open a fresh one."""
+        pool = ConnectionPool(min_size=0, max_size=4)
+        pool.start()
+        dead, fresh = make_conn(), make_conn()
+        dead.cursor.return_value.execute.side_effect = pyodbc.Error(
+            "08S01", "Communication link failure"
+        )
+        stale = time.monotonic() - (server._POOL_VALIDATE_IDLE + 1)
+        pool._pool.put_nowait((dead, stale))
+
+        with patch("mssql_mcp_server.server.create_connection", return_value=fresh):
+            with pool.acquire() as borrowed:
+                assert borrowed is fresh
+
+        dead.close.assert_called_once()
+        assert pool._pool.qsize() == 1
+
+
+class TestPoolQueueBehavior:
+    """Tests for the underlying queue discipline."""
+
+    def test_lifo_order(self, make_conn):
+        """The most recently returned connection should be borrowed first."""
+        pool = ConnectionPool(min_size=0, max_size=4)
+        pool.start()
+        first, second = make_conn(), make_conn()
+        pool._pool.put_nowait((first, time.monotonic()))
+        pool._pool.put_nowait((second, time.monotonic()))
+
+        with pool.acquire() as borrowed:
+            assert borrowed is second
+
+    def test_queue_bounded_by_max_size(self, make_conn):
+        """The pool queue should never exceed max_size."""
+        pool = ConnectionPool(min_size=0, max_size=2)
+        pool.start()
+        for _ in range(2):
+            pool._pool.put_nowait((make_conn(), time.monotonic()))
+
+        with pytest.raises(queue.Full):
+            pool._pool.put_nowait((make_conn(), time.monotonic()))
@@ -201,11 +201,8 @@ class TestDatabaseInfoResource:
         self, mock_connection, mock_cursor, sample_tables
     ):
         """Database info should return server, database, and table count."""
-        # Mock queries for table/view counts and schemas
-        mock_cursor.fetchone.side_effect = [
-            MockRow(cnt=10),  # table_count
-            MockRow(cnt=5),  # view_count
-        ]
+        # Mock the combined counts row and the schema list
+        mock_cursor.fetchone.return_value = MockRow(table_count=10, view_count=5)
         mock_cursor.fetchall.return_value = [
             MockRow(TABLE_SCHEMA="dbo"),
             MockRow(TABLE_SCHEMA="sales"),
@@ -231,10 +228,7 @@ class TestDatabaseInfoResource:
         monkeypatch.setattr(server, "MSSQL_SERVER", "test-server")
         monkeypatch.setattr(server, "MSSQL_DATABASE", "test-db")
 
-        mock_cursor.fetchone.side_effect = [
-            MockRow(cnt=0),
-            MockRow(cnt=0),
-        ]
+        mock_cursor.fetchone.return_value = MockRow(table_count=0, view_count=0)
         mock_cursor.fetchall.return_value = []
 
         with patch(
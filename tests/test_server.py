@@ -5,7 +5,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from mssql_mcp_server.server import create_connection
+from mssql_mcp_server.server import _apply_top_clause, create_connection
 
 
 class TestSecurityFiltering:
@@ -183,6 +183,24 @@ class TestCreateConnection:
         assert "Trusted_Connection=yes" in conn_str
         assert "TrustServerCertificate=yes" in conn_str
 
+    @patch("mssql_mcp_server.server.pyodbc.connect")
+    def test_create_connection_sets_session_defaults(self, mock_connect):
+        """create_connection() should pin the intended session settings.
+
+        ANSI_WARNINGS must stay on: turning it off breaks XML data-type
+        methods and disables filtered indexes for the session.
+        """
+        mock_conn = MagicMock()
+        mock_connect.return_value = mock_conn
+
+        create_connection()
+
+        setup_sql = mock_conn.cursor.return_value.execute.call_args[0][0]
+        assert "SET NOCOUNT ON" in setup_sql
+        assert "SET ARITHABORT ON" in setup_sql
+        assert "SET LOCK_TIMEOUT 5000" in setup_sql
+        assert "ANSI_WARNINGS" not in setup_sql
+
     @patch("mssql_mcp_server.server.pyodbc.connect")
     def test_create_connection_uses_env_vars(self, mock_connect):
         """create_connection() should use environment variables."""
@@ -1313,3 +1331,55 @@ class TestGetTableRelationshipsEnhancements:
         assert "incoming_count" in result
         assert result["outgoing_count"] == len(result["outgoing_relationships"])
         assert result["incoming_count"] == len(result["incoming_relationships"])
+
+
+class TestApplyTopClause:
+    """Tests for the _apply_top_clause query rewrite."""
+
+    def test_inserts_parameterized_top(self):
+        """A plain SELECT should gain a parameterized TOP clause."""
+        query, params = _apply_top_clause("SELECT id FROM users", 100)
+
+        assert query == "SELECT TOP (?) id FROM users"
+        assert params == (100,)
+
+    def test_inserts_top_after_distinct(self):
+        """TOP must land after DISTINCT to stay grammatical."""
+        query, params = _apply_top_clause("SELECT DISTINCT name FROM users", 50)
+
+        assert query == "SELECT DISTINCT TOP (?) name FROM users"
+        assert params == (50,)
+
+    def test_existing_top_left_untouched(self):
+        """Queries that already limit rows should not be rewritten."""
+        original = "SELECT TOP 10 id FROM users"
+        query, params = _apply_top_clause(original, 100)
+
+        assert query == original
+        assert params == ()
+
+    def test_offset_fetch_left_untouched(self):
+        """OFFSET pagination rejects TOP, so the rewrite must skip it."""
+        original = (
+            "SELECT id FROM users ORDER BY id OFFSET 10 ROWS FETCH NEXT 20 ROWS ONLY"
+        )
+        query, params = _apply_top_clause(original, 100)
+
+        assert query == original
+        assert params == ()
+
+    def test_leading_whitespace_preserved(self):
+        """Leading whitespace before SELECT should survive the rewrite."""
+        query, params = _apply_top_clause("  select id from users", 5)
+
+        assert query == "  select TOP (?) id from users"
+        assert params == (5,)
+
+    def test_non_select_left_untouched(self):
+        """Text without a SELECT prefix should pass through unchanged."""
+        query, params = _apply_top_clause(
+            "WITH x AS (SELECT 1 AS a) SELECT a FROM x", 5
+        )
+
+        assert query == "WITH x AS (SELECT 1 AS a) SELECT a FROM x"
+        assert params == ()